@@ -18,7 +18,7 @@ Typical output format:
 """
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from adapters.base import BaseCLIAdapter
 
 
@@ -35,6 +35,24 @@ class LlamaCppAdapter(BaseCLIAdapter):
         "~/.lmstudio/models",  # LM Studio's model directory
     ]
 
+    # Metadata line prefixes to filter out of the output
+    METADATA_PREFIXES = (
+        "llama_model_loader:",
+        "llm_load_print_meta:",
+        "llama_new_context_with_model:",
+        "llama_print_timings:",
+        "sampling:",
+        "generate:",
+        "llm_load_tensors:",
+        "llama_kv_cache_init:",
+        "system_info:",
+        "ggml_",  # ggml library messages
+        "gguf_",  # gguf format messages
+    )
+
+    # Exact matches to filter out (interactive prompts, EOF markers)
+    METADATA_EXACT = frozenset({"> EOF by user", ">", "EOF"})
+
     def __init__(
         self,
         command: str = "llama-cli",
@@ -58,6 +76,12 @@ class LlamaCppAdapter(BaseCLIAdapter):
             raise ValueError("args must be provided from config.yaml")
         super().__init__(command=command, args=args, timeout=timeout)
         self.search_paths = search_paths or self.DEFAULT_SEARCH_PATHS
+        # Model name lookups already resolved, keyed by (name, search paths)
+        self._resolved_models: dict[tuple[str, tuple[Path, ...]], str] = {}
+        # Memoized ((env var, search_paths), expanded paths)
+        self._expanded_search_paths: Optional[
+            tuple[tuple[Optional[str], tuple[str, ...]], tuple[Path, ...]]
+        ] = None
 
     async def invoke(
         self,
@@ -121,14 +145,53 @@ class LlamaCppAdapter(BaseCLIAdapter):
         if os.path.exists(model):
             return os.path.abspath(model)
 
-        # Try to find model by name in search paths
-        found_models = self._find_models_by_name(model)
+        # Reuse an earlier lookup while the resolved file still exists, so
+        # repeated rounds don't rescan the model directories
+        cache_key = (model, self._get_expanded_search_paths())
+        cached = self._resolved_models.get(cache_key)
+        if cached is not None and os.path.exists(cached):
+            return cached
+
+        resolved = self._search_model_path(model)
+        self._resolved_models[cache_key] = resolved
+        return resolved
+
+    def _search_model_path(self, model: str) -> str:
+        """
+        Search the model directories for the best match for a model name.
+
+        Args:
+            model: Model name (can be partial)
+
+        Returns:
+            Path to the best matching model file
+
+        Raises:
+            FileNotFoundError: If no model matches
+        """
+        # An exact name match wins every tie-break, so return the first one
+        # as soon as the walk reaches it instead of scanning the remaining
+        # directories; otherwise collect fuzzy matches for the fallbacks.
+        # Every file seen is kept too, so a failed lookup can list the
+        # available models without walking the directories a second time.
+        model_lower = model.lower()
+        found_models = []
+        all_models = []
+        for search_path, model_path in self._iter_gguf_models():
+            all_models.append((search_path, model_path))
+            stem = self._model_stem(model_path)
+            # Check if name appears in filename (fuzzy match)
+            if model_lower not in stem.lower():
+                continue
+            if stem == model or os.path.basename(model_path) == model:
+                return model_path
+            found_models.append(model_path)
 
         if not found_models:
             raise FileNotFoundError(
                 f"Model not found: '{model}'\n\n"
                 f"Searched in:\n" + "\n".join(f"  - {p}" for p in self._get_expanded_search_paths()) + "\n\n"
-                f"Available models:\n" + self._format_available_models() + "\n\n"
+                f"Available models:\n" + self._format_available_models(all_models) + "\n\n"
                 f"Tips:\n"
                 f"  - Use full path: '/path/to/model.gguf'\n"
                 f"  - Download models from: https://huggingface.co/models?library=gguf\n"
@@ -137,105 +200,134 @@ class LlamaCppAdapter(BaseCLIAdapter):
 
         # If exactly one match, use it
         if len(found_models) == 1:
-            return str(found_models[0])
-
-        # Multiple matches - prefer exact name match, then shortest path
-        for candidate in found_models:
-            if candidate.stem == model or candidate.name == model:
-                return str(candidate)
+            return found_models[0]
 
         # No exact match, return shortest path (most likely to be correct)
-        shortest = min(found_models, key=lambda p: len(str(p)))
-        return str(shortest)
+        return min(found_models, key=len)
 
-    def _find_models_by_name(self, name: str) -> list[Path]:
+    def _iter_gguf_models(self) -> Iterator[tuple[Path, str]]:
         """
-        Find GGUF model files matching the given name.
+        Find GGUF model files in all search paths, lazily.
 
-        Performs fuzzy matching - "llama-2-7b" matches "llama-2-7b-chat.Q4_K_M.gguf".
-
-        Args:
-            name: Model name (can be partial)
-
-        Returns:
-            List of matching Path objects
+        Yields:
+            (search_path, model_path) pairs, in search path order
         """
-        matches = []
-        name_lower = name.lower()
-
         for search_path in self._get_expanded_search_paths():
             if not search_path.exists():
                 continue
 
             # Search recursively for .gguf files
-            for model_file in search_path.rglob("*.gguf"):
-                # Check if name appears in filename (fuzzy match)
-                if name_lower in model_file.stem.lower():
-                    matches.append(model_file)
+            for model_path in self._iter_gguf_files(str(search_path)):
+                yield search_path, model_path
+
+    @staticmethod
+    def _model_stem(model_path: str) -> str:
+        """
+        Return the file stem of a .gguf path without building a Path object.
 
-        return matches
+        Matches Path.stem: a bare ".gguf" name has no suffix to strip.
+        """
+        name = os.path.basename(model_path)
+        return name[:-5] if len(name) > 5 else name
 
-    def _get_expanded_search_paths(self) -> list[Path]:
+    @staticmethod
+    def _iter_gguf_files(root: str) -> Iterator[str]:
+        """
+        Yield paths of .gguf entries under a directory, recursively.
+
+        Uses one os.scandir listing per directory with an explicit stack, and
+        yields in the same order as Path.rglob("*.gguf"): a directory's own
+        matches first, then its subdirectories depth-first. Symlinked
+        directories are not followed, and directories that cannot be listed
+        (unreadable, removed mid-walk, or a root that is not a directory)
+        are skipped.
+
+        Args:
+            root: Directory to search
+
+        Yields:
+            Paths of entries whose name ends in ".gguf"
+        """
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                if entry.name.endswith(".gguf"):
+                    yield entry.path
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+
+            # Reversed so the first subdirectory is popped (visited) first
+            stack.extend(reversed(subdirs))
+
+    def _get_expanded_search_paths(self) -> tuple[Path, ...]:
         """
         Get search paths with environment variables and ~ expanded.
 
-        Also checks LLAMA_CPP_MODEL_PATH environment variable.
+        Also checks LLAMA_CPP_MODEL_PATH environment variable. The result is
+        memoized until the variable or search_paths change.
 
         Returns:
-            List of expanded Path objects
+            Tuple of expanded Path objects, deduplicated in order
         """
+        env_path = os.environ.get("LLAMA_CPP_MODEL_PATH")
+        key = (env_path, tuple(self.search_paths))
+        if self._expanded_search_paths is not None:
+            cached_key, cached_paths = self._expanded_search_paths
+            if cached_key == key:
+                return cached_paths
+
         paths = []
 
         # Add paths from environment variable
-        env_path = os.environ.get("LLAMA_CPP_MODEL_PATH")
         if env_path:
             paths.extend(env_path.split(":"))
 
         # Add default search paths
         paths.extend(self.search_paths)
 
-        # Expand and deduplicate
-        expanded = []
-        seen = set()
-        for path_str in paths:
-            expanded_path = Path(path_str).expanduser()
-            if str(expanded_path) not in seen:
-                seen.add(str(expanded_path))
-                expanded.append(expanded_path)
+        # Expand and deduplicate (dict keeps first-seen order)
+        expanded = tuple(dict.fromkeys(Path(path_str).expanduser() for path_str in paths))
 
+        self._expanded_search_paths = (key, expanded)
         return expanded
 
-    def _format_available_models(self) -> str:
+    def _format_available_models(self, models: list[tuple[Path, str]]) -> str:
         """
         Format a list of available models for error messages.
 
+        Args:
+            models: (search_path, model_path) pairs collected by the search
+
         Returns:
             Formatted string listing available models
         """
-        all_models = []
-
-        for search_path in self._get_expanded_search_paths():
-            if not search_path.exists():
-                continue
-
-            for model_file in search_path.rglob("*.gguf"):
-                # Show relative path if in search dir, else full path
-                try:
-                    rel_path = model_file.relative_to(search_path)
-                    display_path = f"{search_path.name}/{rel_path}"
-                except ValueError:
-                    display_path = str(model_file)
-
-                all_models.append(f"  - {model_file.stem} ({display_path})")
-
-        if not all_models:
+        if not models:
             return "  (No .gguf models found in search paths)"
 
         # Limit to first 10 to avoid overwhelming output
-        if len(all_models) > 10:
-            return "\n".join(all_models[:10]) + f"\n  ... and {len(all_models) - 10} more"
+        lines = []
+        for search_path, model_path in models[:10]:
+            # Show relative path if in search dir, else full path
+            try:
+                rel_path = os.path.relpath(model_path, search_path)
+                display_path = f"{search_path.name}/{rel_path}"
+            except ValueError:
+                display_path = model_path
+
+            lines.append(f"  - {self._model_stem(model_path)} ({display_path})")
 
-        return "\n".join(all_models)
+        if len(models) > 10:
+            lines.append(f"  ... and {len(models) - 10} more")
+
+        return "\n".join(lines)
 
     def parse_output(self, raw_output: str) -> str:
         """
@@ -259,46 +351,17 @@ class LlamaCppAdapter(BaseCLIAdapter):
             Extracted model response with metadata removed
         """
         lines = raw_output.strip().split("\n")
-
-        # Metadata prefixes to filter out
-        metadata_prefixes = [
-            "llama_model_loader:",
-            "llm_load_print_meta:",
-            "llama_new_context_with_model:",
-            "llama_print_timings:",
-            "sampling:",
-            "generate:",
-            "llm_load_tensors:",
-            "llama_kv_cache_init:",
-            "system_info:",
-            "ggml_",  # ggml library messages
-            "gguf_",  # gguf format messages
+        prefixes = self.METADATA_PREFIXES
+        exact = self.METADATA_EXACT
+
+        # Keep lines whose stripped form is neither a metadata prefix match
+        # (one C-level startswith over the whole tuple) nor an exact marker
+        response_lines = [
+            line
+            for line, stripped in zip(lines, map(str.strip, lines))
+            if not stripped.startswith(prefixes) and stripped not in exact
         ]
 
-        # Exact matches to filter out (interactive prompts, EOF markers)
-        metadata_exact = [
-            "> EOF by user",
-            ">",
-            "EOF",
-        ]
-
-        # Filter out metadata lines
-        response_lines = []
-        for line in lines:
-            stripped = line.strip()
-
-            # Check if line starts with any metadata prefix
-            is_metadata = any(
-                stripped.startswith(prefix) for prefix in metadata_prefixes
-            )
-
-            # Check if line exactly matches any metadata pattern
-            is_exact_match = stripped in metadata_exact
-
-            # Keep line if it's not metadata
-            if not is_metadata and not is_exact_match:
-                response_lines.append(line)
-
         # Join and strip the result
         response = "\n".join(response_lines).strip()
         return response
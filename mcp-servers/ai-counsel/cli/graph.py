@@ -379,9 +379,9 @@ def export(format: str, output: Optional[str], db: str) -> None:
             click.echo(f"Unknown format: {format}", err=True)
             sys.exit(1)
 
-        # Write to file or stdout
+        # Write to file (whole export in one write) or stdout
         if output:
-            Path(output).write_text(result)
+            Path(output).write_text(result, encoding="utf-8")
             click.echo(f"Exported {len(decisions)} decisions to {output}")
         else:
             click.echo(result)
@@ -1,4 +1,5 @@
 """Convergence detection for deliberation rounds."""
+import functools
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -29,6 +30,28 @@ class SimilarityBackend(ABC):
         """
         pass
 
+    def compute_similarity_matrix(self, texts: List[str]) -> List[List[float]]:
+        """
+        Compute pairwise similarity between all texts.
+
+        The default implementation calls compute_similarity once per pair.
+        Backends that can score a batch more cheaply should override this.
+
+        Args:
+            texts: Texts to compare
+
+        Returns:
+            Square matrix where entry [i][j] is the similarity of texts[i] and texts[j]
+        """
+        n = len(texts)
+        matrix = [[1.0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                similarity = self.compute_similarity(texts[i], texts[j])
+                matrix[i][j] = similarity
+                matrix[j][i] = similarity
+        return matrix
+
 
 # =============================================================================
 # Jaccard Backend (Zero Dependencies)
@@ -147,6 +170,25 @@ class TFIDFBackend(SimilarityBackend):
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=4)
+def _load_sentence_transformer(model_name: str):
+    """
+    Load a sentence transformer model once per process.
+
+    Loading weights dominates first-call latency, so every backend (and every
+    engine) asking for the same model shares one instance.
+
+    Raises:
+        ImportError: If sentence-transformers is not installed (not cached)
+    """
+    from sentence_transformers import SentenceTransformer
+
+    logger.info(f"Loading sentence transformer model: {model_name}")
+    model = SentenceTransformer(model_name)
+    logger.info("Sentence transformer model loaded and cached successfully")
+    return model
+
+
 class SentenceTransformerBackend(SimilarityBackend):
     """
     Sentence transformer backend using neural embeddings.
@@ -167,13 +209,9 @@ class SentenceTransformerBackend(SimilarityBackend):
 
     Performance:
         - Model cached in memory after first load (~3 seconds)
-        - Subsequent instances reuse cached model (instant)
+        - Subsequent instances reuse cached model (instant), per model name
     """
 
-    # Class-level cache to share model across instances
-    _model_cache = None
-    _model_name_cache = None
-
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
         """
         Initialize sentence transformer backend.
@@ -183,24 +221,9 @@ class SentenceTransformerBackend(SimilarityBackend):
                        This is a good balance of speed and accuracy.
         """
         try:
-            from sentence_transformers import SentenceTransformer
             from sklearn.metrics.pairwise import cosine_similarity
 
-            # Check if we can reuse cached model
-            if (
-                SentenceTransformerBackend._model_cache is not None
-                and SentenceTransformerBackend._model_name_cache == model_name
-            ):
-                logger.info(f"Reusing cached sentence transformer model: {model_name}")
-                self.model = SentenceTransformerBackend._model_cache
-            else:
-                logger.info(f"Loading sentence transformer model: {model_name}")
-                self.model = SentenceTransformer(model_name)
-                # Cache for future instances
-                SentenceTransformerBackend._model_cache = self.model
-                SentenceTransformerBackend._model_name_cache = model_name
-                logger.info("Sentence transformer model loaded and cached successfully")
-
+            self.model = _load_sentence_transformer(model_name)
             self.cosine_similarity = cosine_similarity
 
         except ImportError as e:
@@ -224,6 +247,18 @@ class SentenceTransformerBackend(SimilarityBackend):
 
         return float(similarity)
 
+    def compute_similarity_matrix(self, texts: List[str]) -> List[List[float]]:
+        """
+        Compute pairwise semantic similarity with one batched encode.
+
+        Embeddings are L2-normalized, so the cosine matrix is a single
+        matrix product instead of one model forward pass per pair.
+        """
+        embeddings = self.model.encode(
+            texts, batch_size=32, normalize_embeddings=True, convert_to_numpy=True
+        )
+        return (embeddings @ embeddings.T).tolist()
+
 
 # =============================================================================
 # Convergence Result
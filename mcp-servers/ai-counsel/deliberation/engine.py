@@ -1,7 +1,9 @@
 """Deliberation engine for orchestrating multi-model discussions."""
 import asyncio
+import bisect
 import json
 import logging
+import os
 import re
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +21,52 @@ from models.tool_schema import ToolExecutionRecord
 
 logger = logging.getLogger(__name__)
 
+# Minimum similarity for two vote options to be merged into one tally entry.
+# Vote grouping should only merge typos/aliases, not different choices:
+# "Option A" vs "option_a" (0.95+) should merge, "Option A" vs "Option D"
+# (0.729) should not - a 0.70 threshold once merged exactly that pair.
+# Override with AI_COUNSEL_MERGE_THRESHOLD; values outside 0.70-0.95 are ignored.
+_DEFAULT_MERGE_THRESHOLD = 0.85
+_MERGE_THRESHOLD_RANGE = (0.70, 0.95)
+
+
+def _merge_threshold_from_env() -> float:
+    """
+    Read the vote merge threshold from AI_COUNSEL_MERGE_THRESHOLD.
+
+    Falls back to the default, with a warning, when the variable is not a
+    number or lies outside the useful 0.70-0.95 range, so a bad value cannot
+    stop the server from importing this module.
+
+    Returns:
+        Merge threshold to use for vote grouping
+    """
+    raw = os.environ.get("AI_COUNSEL_MERGE_THRESHOLD")
+    if raw is None:
+        return _DEFAULT_MERGE_THRESHOLD
+
+    low, high = _MERGE_THRESHOLD_RANGE
+    try:
+        threshold = float(raw)
+        valid = low <= threshold <= high
+    except ValueError:
+        valid = False
+
+    if not valid:
+        logger.warning(
+            f"Ignoring AI_COUNSEL_MERGE_THRESHOLD={raw!r}: expected a number "
+            f"between {low} and {high}; using {_DEFAULT_MERGE_THRESHOLD}"
+        )
+        return _DEFAULT_MERGE_THRESHOLD
+
+    return threshold
+
+
+SEMANTIC_MERGE_THRESHOLD = _merge_threshold_from_env()
+
+# Appended to tool output cut by _truncate_output (chars dropped, lines dropped)
+_TRUNCATION_SUFFIX = "\n... [truncated {} chars, {} lines]"
+
 if TYPE_CHECKING:
     from decision_graph.integration import DecisionGraphIntegration
     from deliberation.transcript import TranscriptManager
@@ -267,46 +315,26 @@ The following files are available in the working directory:
             else None
         )
 
-        for participant in participants:
-            # Get the appropriate adapter
-            adapter = self.adapters[participant.cli]
-
-            logger.info(
-                f"Round {round_num}: Invoking {participant.model}@{participant.cli} "
-                f"with prompt_length={len(enhanced_prompt)} chars, "
-                f"context_length={len(context) if context else 0} chars, "
-                f"working_directory={working_directory}"
-            )
-            logger.debug(
-                f"Enhanced prompt preview for {participant.model}@{participant.cli}: "
-                f"{enhanced_prompt[:300]}..."
-            )
-
-            # Invoke the adapter with error handling
-            try:
-                response_text = await adapter.invoke(
-                    prompt=enhanced_prompt,
-                    model=participant.model,
-                    context=context,
-                    is_deliberation=True,  # Always True during deliberations
-                    working_directory=working_directory,
-                )
-                logger.info(
-                    f"Round {round_num}: Received response from {participant.model}@{participant.cli}, "
-                    f"response_length={len(response_text)} chars"
-                )
-                logger.debug(
-                    f"Response preview from {participant.model}@{participant.cli}: "
-                    f"{response_text[:300]}..."
-                )
-            except Exception as e:
-                # Log error but continue with other participants
-                logger.error(
-                    f"Adapter {participant.cli} failed for model {participant.model}: {e}",
-                    exc_info=True,
+        # Resolve adapters up front so an unknown CLI fails before any invocation
+        participant_adapters = [self.adapters[p.cli] for p in participants]
+
+        # Invoke all participants concurrently: round latency becomes the
+        # slowest adapter rather than the sum of all of them
+        response_texts = await asyncio.gather(
+            *(
+                self._invoke_participant(
+                    adapter,
+                    participant,
+                    round_num,
+                    enhanced_prompt,
+                    context,
+                    working_directory,
                 )
-                response_text = f"[ERROR: {type(e).__name__}: {str(e)}]"
+                for adapter, participant in zip(participant_adapters, participants)
+            )
+        )
 
+        for participant, response_text in zip(participants, response_texts):
             # Parse and execute tool requests if tool executor is available
             if self.tool_executor:
                 tool_requests = self.tool_executor.parse_tool_requests(response_text)
@@ -370,6 +398,67 @@ The following files are available in the working directory:
 
         return responses
 
+    async def _invoke_participant(
+        self,
+        adapter: BaseCLIAdapter | BaseHTTPAdapter,
+        participant: Participant,
+        round_num: int,
+        prompt: str,
+        context: Optional[str],
+        working_directory: Optional[str],
+    ) -> str:
+        """
+        Invoke one participant's adapter for a round.
+
+        Args:
+            adapter: Adapter for the participant's CLI
+            participant: Participant to invoke
+            round_num: Current round number (for logging)
+            prompt: Enhanced prompt for this round
+            context: Context from previous rounds, if any
+            working_directory: Optional working directory for tool execution
+
+        Returns:
+            Response text, or an "[ERROR: ...]" marker if the adapter failed
+        """
+        logger.info(
+            f"Round {round_num}: Invoking {participant.model}@{participant.cli} "
+            f"with prompt_length={len(prompt)} chars, "
+            f"context_length={len(context) if context else 0} chars, "
+            f"working_directory={working_directory}"
+        )
+        logger.debug(
+            f"Enhanced prompt preview for {participant.model}@{participant.cli}: "
+            f"{prompt[:300]}..."
+        )
+
+        # Invoke the adapter with error handling
+        try:
+            response_text = await adapter.invoke(
+                prompt=prompt,
+                model=participant.model,
+                context=context,
+                is_deliberation=True,  # Always True during deliberations
+                working_directory=working_directory,
+            )
+            logger.info(
+                f"Round {round_num}: Received response from {participant.model}@{participant.cli}, "
+                f"response_length={len(response_text)} chars"
+            )
+            logger.debug(
+                f"Response preview from {participant.model}@{participant.cli}: "
+                f"{response_text[:300]}..."
+            )
+        except Exception as e:
+            # Log error but continue with other participants
+            logger.error(
+                f"Adapter {participant.cli} failed for model {participant.model}: {e}",
+                exc_info=True,
+            )
+            response_text = f"[ERROR: {type(e).__name__}: {str(e)}]"
+
+        return response_text
+
     def _truncate_output(
         self, output: Optional[str], max_chars: int = 1000
     ) -> Optional[str]:
@@ -386,11 +475,11 @@ The following files are available in the working directory:
         if not output or len(output) <= max_chars:
             return output
 
-        truncated = output[:max_chars]
-        chars_truncated = len(output) - max_chars
-        lines_truncated = output.count("\n") - truncated.count("\n")
-
-        return f"{truncated}\n... [truncated {chars_truncated} chars, {lines_truncated} lines]"
+        # Count newlines only in the dropped tail instead of scanning both
+        # the full output and the kept prefix
+        return output[:max_chars] + _TRUNCATION_SUFFIX.format(
+            len(output) - max_chars, output.count("\n", max_chars)
+        )
 
     def _build_context(
         self,
@@ -437,13 +526,19 @@ The following files are available in the working directory:
                 else 1000
             )
 
-            # Filter to recent N rounds
+            # Keep only the recent N rounds by binary-searching the window start.
+            # Invariant: tool_execution_history is sorted by round_number.
+            # execute_round appends records for its own round after all earlier
+            # rounds, and execute() clears the list before round 1. Anything
+            # that appends out of round order must re-sort the list, or older
+            # records past the window start would be silently dropped.
             min_round = max(1, current_round_num - max_rounds)
-            recent_tools = [
-                record
-                for record in self.tool_execution_history
-                if record.round_number >= min_round
-            ]
+            start = bisect.bisect_left(
+                self.tool_execution_history,
+                min_round,
+                key=lambda record: record.round_number,
+            )
+            recent_tools = self.tool_execution_history[start:]
 
             if recent_tools:
                 context_parts.append("\n## Recent Tool Results\n")
@@ -579,7 +674,8 @@ The following files are available in the working directory:
         Group semantically similar vote options together.
 
         If convergence detector is available and has a similarity backend,
-        uses semantic similarity to match options with > 0.85 threshold.
+        uses semantic similarity to match options at or above
+        SEMANTIC_MERGE_THRESHOLD (default 0.85).
         Otherwise falls back to exact string matching.
 
         Args:
@@ -595,51 +691,50 @@ The following files are available in the working directory:
 
         try:
             backend = self.convergence_detector.backend
-            # Use high threshold (0.85) for vote option matching to avoid merging different options
-            # Vote grouping should only merge typos/aliases, not semantically different choices
-            # Example: "Option A" vs "option_a" (0.95+) should merge, but "Option A" vs "Option D" (0.729) should not
-            # Bug fix: Was 0.70 which caused "Option A" and "Option D" to merge at 0.729 similarity
-            similarity_threshold = 0.85
+            similarity_threshold = SEMANTIC_MERGE_THRESHOLD
 
             logger.info(
                 f"Starting vote option grouping with {len(all_options)} unique options"
             )
 
-            # Build groups of similar options
-            groups = []  # List of (canonical_option, [similar_options])
-            used_options = set()
-
-            for option_a in all_options:
-                if option_a in used_options:
-                    continue
-
-                # Start new group with this option
-                group = [option_a]
-                used_options.add(option_a)
-
-                # Find all similar options
-                for option_b in all_options:
-                    if option_b not in used_options:
-                        similarity = backend.compute_similarity(option_a, option_b)
-                        logger.info(
-                            f"Vote similarity: '{option_a}' vs '{option_b}': {similarity:.3f} (threshold: {similarity_threshold})"
-                        )
-                        if similarity >= similarity_threshold:
+            # Score every pair of options in one batch
+            similarity_matrix = backend.compute_similarity_matrix(all_options)
+
+            # Union-find over the similar pairs so merging is transitive
+            # (A~B and B~C puts A, B, C in one group) and independent of the
+            # order pairs are visited. The root is always the lowest index,
+            # so each group is named after its first-seen option.
+            parent = list(range(len(all_options)))
+
+            def find(i: int) -> int:
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+
+            for i, option_a in enumerate(all_options):
+                for j in range(i + 1, len(all_options)):
+                    option_b = all_options[j]
+                    similarity = float(similarity_matrix[i][j])
+                    logger.info(
+                        f"Vote similarity: '{option_a}' vs '{option_b}': {similarity:.3f} (threshold: {similarity_threshold})"
+                    )
+                    if similarity >= similarity_threshold:
+                        root_a, root_b = find(i), find(j)
+                        if root_a != root_b:
                             logger.info(f"  ✓ Grouping '{option_b}' with '{option_a}'")
-                            group.append(option_b)
-                            used_options.add(option_b)
-
-                groups.append((option_a, group))
+                            parent[max(root_a, root_b)] = min(root_a, root_b)
 
-            # Merge tally by groups
-            grouped_tally = {}
-            for canonical_option, similar_options in groups:
-                # Sum votes for all similar options
-                total_votes = sum(raw_tally.get(opt, 0) for opt in similar_options)
-                grouped_tally[canonical_option] = total_votes
+            # Merge tally by groups, summing votes for all similar options
+            grouped_tally: Dict[str, int] = {}
+            for i, option in enumerate(all_options):
+                canonical_option = all_options[find(i)]
+                grouped_tally[canonical_option] = grouped_tally.get(
+                    canonical_option, 0
+                ) + raw_tally.get(option, 0)
 
             logger.info(
-                f"Vote option grouping complete: {len(all_options)} options -> {len(groups)} groups. "
+                f"Vote option grouping complete: {len(all_options)} options -> {len(grouped_tally)} groups. "
                 f"Grouped tally: {grouped_tally}"
             )
 
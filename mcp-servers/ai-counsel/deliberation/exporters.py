@@ -4,16 +4,81 @@ Supports GraphML, Graphviz DOT, JSON, and Markdown formats for
 visualization and analysis in external tools.
 """
 
+import functools
+import heapq
 import json
 import logging
+import operator
+import re
 from datetime import datetime
 from typing import List, Optional
 
 from decision_graph.schema import DecisionNode, DecisionSimilarity
 from deliberation.query_engine import SimilarResult
 
+try:
+    # Optional: orjson serializes indented JSON far faster than the stdlib,
+    # whose C encoder is bypassed whenever indent is set
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Graphviz fill color per convergence status (unknown statuses are white)
+_DOT_STATUS_COLORS = {
+    "converged": "lightgreen",
+    "refining": "lightyellow",
+    "diverging": "lightcoral",
+    "unanimous_consensus": "lightblue",
+    "majority_decision": "lightcyan",
+    "tie": "lightgray",
+}
+
+# Static GraphML sections, joined once at import rather than per export
+_GRAPHML_HEADER = "\n".join(
+    [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns"',
+        '  xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
+        '  xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns',
+        '  http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">',
+        '  <graph mode="static" defaultedgetype="directed">',
+        "    <!-- Nodes -->",
+        # Node attributes
+        '    <key id="d_question" for="node" attr.name="question" attr.type="string"/>',
+        '    <key id="d_consensus" for="node" attr.name="consensus" attr.type="string"/>',
+        '    <key id="d_status" for="node" attr.name="status" attr.type="string"/>',
+        '    <key id="d_timestamp" for="node" attr.name="timestamp" attr.type="string"/>',
+    ]
+)
+_GRAPHML_EDGES_HEADER = (
+    "    <!-- Edges -->\n"
+    '    <key id="d_weight" for="edge" attr.name="weight" attr.type="double"/>'
+)
+_GRAPHML_FOOTER = "  </graph>\n</graphml>"
+
+# DOT export only draws similarity edges strictly above this score
+_DOT_MIN_EDGE_WEIGHT = 0.6
+
+# Sort key for ranking relationships (C-level getter, no lambda frame)
+_BY_SIMILARITY_SCORE = operator.attrgetter("similarity_score")
+
+# Pre-rendered search-results table borders; row widths must match them
+_SUMMARY_TABLE_HEADER = "\n".join(
+    [
+        "\n╔═══════════════════════════════════════════════════════════════════╗",
+        "║ Similar Decisions                                                 ║",
+        "╠═════════╦═══════════════════════════════╦════════════╦═════════════╣",
+        "║ Score   ║ Question                      ║ Consensus  ║ Status      ║",
+        "╠═════════╬═══════════════════════════════╬════════════╬═════════════╣",
+    ]
+)
+_SUMMARY_ROW_FORMAT = "║ {} ║ {:<29} ║ {:<10} ║ {:<11} ║"
+_SUMMARY_TABLE_FOOTER = (
+    "╚═════════╩═══════════════════════════════╩════════════╩═════════════╝\n"
+)
+
 
 class DecisionGraphExporter:
     """Export decision graph to various formats."""
@@ -22,20 +87,27 @@ class DecisionGraphExporter:
     def to_json(
         decisions: List[DecisionNode],
         similarities: Optional[List[DecisionSimilarity]] = None,
+        *,
+        generated_at: Optional[datetime] = None,
     ) -> str:
         """Export decisions to JSON format.
 
         Args:
             decisions: List of DecisionNode objects
             similarities: Optional list of DecisionSimilarity relationships
+            generated_at: Export timestamp (defaults to now); pass one value
+                to stamp a batch of exports consistently
 
         Returns:
             JSON string with decision graph data
         """
+        if generated_at is None:
+            generated_at = datetime.now()
+
         data = {
             "format": "decision_graph_json",
             "version": "1.0",
-            "exported_at": datetime.now().isoformat(),
+            "exported_at": generated_at.isoformat(),
             "decisions": [
                 {
                     "id": d.id,
@@ -63,7 +135,10 @@ class DecisionGraphExporter:
                 for s in similarities
             ]
 
-        return json.dumps(data, indent=2)
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        # Match orjson, which writes non-ASCII characters unescaped
+        return json.dumps(data, indent=2, ensure_ascii=False)
 
     @staticmethod
     def to_graphml(
@@ -79,65 +154,31 @@ class DecisionGraphExporter:
         Returns:
             GraphML XML string
         """
-        graphml = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns"',
-            '  xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
-            '  xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns',
-            '  http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">',
-            '  <graph mode="static" defaultedgetype="directed">',
-            "    <!-- Nodes -->",
-        ]
+        graphml = [_GRAPHML_HEADER]
 
-        # Add node attributes
+        # Add nodes (one list entry per node; joined once at the end)
         graphml.extend(
-            [
-                '    <key id="d_question" for="node" attr.name="question" attr.type="string"/>',
-                '    <key id="d_consensus" for="node" attr.name="consensus" attr.type="string"/>',
-                '    <key id="d_status" for="node" attr.name="status" attr.type="string"/>',
-                '    <key id="d_timestamp" for="node" attr.name="timestamp" attr.type="string"/>',
-            ]
+            f'    <node id="{decision.id}">\n'
+            f'      <data key="d_question">{_escape_xml(decision.question)}</data>\n'
+            f'      <data key="d_consensus">{_escape_xml(decision.consensus)}</data>\n'
+            f'      <data key="d_status">{decision.convergence_status}</data>\n'
+            f'      <data key="d_timestamp">{decision.timestamp.isoformat()}</data>\n'
+            "    </node>"
+            for decision in decisions
         )
 
-        # Add nodes
-        for decision in decisions:
-            graphml.append(f'    <node id="{decision.id}">')
-            graphml.append(
-                f'      <data key="d_question">{_escape_xml(decision.question)}</data>'
-            )
-            graphml.append(
-                f'      <data key="d_consensus">{_escape_xml(decision.consensus)}</data>'
-            )
-            graphml.append(
-                f'      <data key="d_status">{decision.convergence_status}</data>'
-            )
-            graphml.append(
-                f'      <data key="d_timestamp">{decision.timestamp.isoformat()}</data>'
-            )
-            graphml.append("    </node>")
-
-        graphml.append("    <!-- Edges -->")
-        graphml.append(
-            '    <key id="d_weight" for="edge" attr.name="weight" attr.type="double"/>'
-        )
+        graphml.append(_GRAPHML_EDGES_HEADER)
 
         # Add edges (similarities)
         if similarities:
-            for sim in similarities:
-                graphml.append(
-                    f'    <edge source="{sim.source_id}" target="{sim.target_id}">'
-                )
-                graphml.append(
-                    f'      <data key="d_weight">{sim.similarity_score}</data>'
-                )
-                graphml.append("    </edge>")
+            graphml.extend(
+                f'    <edge source="{sim.source_id}" target="{sim.target_id}">\n'
+                f'      <data key="d_weight">{sim.similarity_score}</data>\n'
+                "    </edge>"
+                for sim in similarities
+            )
 
-        graphml.extend(
-            [
-                "  </graph>",
-                "</graphml>",
-            ]
-        )
+        graphml.append(_GRAPHML_FOOTER)
 
         return "\n".join(graphml)
 
@@ -161,31 +202,23 @@ class DecisionGraphExporter:
             "  node [shape=box, style=rounded];",
         ]
 
-        # Add nodes
+        # Add nodes (hot loop: bind lookups to locals once)
+        append = lines.append
+        truncate = _truncate_text
+        status_color = _DOT_STATUS_COLORS.get
         for decision in decisions:
-            label = _truncate_text(decision.question, 40)
-            status_color = {
-                "converged": "lightgreen",
-                "refining": "lightyellow",
-                "diverging": "lightcoral",
-                "unanimous_consensus": "lightblue",
-                "majority_decision": "lightcyan",
-                "tie": "lightgray",
-            }.get(decision.convergence_status, "white")
-
-            lines.append(
-                f'  "{decision.id}" [label="{label}", fillcolor={status_color}, style="rounded,filled"];'
+            append(
+                f'  "{decision.id}" [label="{truncate(decision.question, 40)}", '
+                f'fillcolor={status_color(decision.convergence_status, "white")}, style="rounded,filled"];'
             )
 
-        # Add edges
+        # Add edges, only showing strong similarities
         if similarities:
-            for sim in similarities:
-                weight = sim.similarity_score
-                # Only show strong similarities
-                if weight > 0.6:
-                    lines.append(
-                        f'  "{sim.source_id}" -> "{sim.target_id}" [label="{weight:.2f}", weight={weight}];'
-                    )
+            lines.extend(
+                f'  "{sim.source_id}" -> "{sim.target_id}" [label="{sim.similarity_score:.2f}", weight={sim.similarity_score}];'
+                for sim in similarities
+                if sim.similarity_score > _DOT_MIN_EDGE_WEIGHT
+            )
 
         lines.append("}")
         return "\n".join(lines)
@@ -194,43 +227,49 @@ class DecisionGraphExporter:
     def to_markdown(
         decisions: List[DecisionNode],
         similarities: Optional[List[DecisionSimilarity]] = None,
+        *,
+        generated_at: Optional[datetime] = None,
     ) -> str:
         """Export decisions to Markdown format.
 
         Args:
             decisions: List of DecisionNode objects
             similarities: Optional list of DecisionSimilarity relationships
+            generated_at: Report timestamp (defaults to now); pass one value
+                to stamp a batch of exports consistently
 
         Returns:
             Markdown formatted string
         """
+        if generated_at is None:
+            generated_at = datetime.now()
+
         lines = [
             "# Decision Graph Memory Report",
-            f"\n_Generated: {datetime.now().isoformat()}_\n",
+            f"\n_Generated: {generated_at.isoformat()}_\n",
             f"## Summary\n- Total Decisions: {len(decisions)}\n",
         ]
 
         if similarities:
             lines.append(f"- Total Relationships: {len(similarities)}\n")
 
-        lines.extend(
-            [
-                "\n## Decisions\n",
-            ]
-        )
+        lines.append("\n## Decisions\n")
 
+        # Hot loop: bind lookups to locals once
+        extend = lines.extend
+        escape = _escape_markdown
         for i, decision in enumerate(decisions, 1):
-            lines.extend(
-                [
-                    f"### {i}. {_escape_markdown(decision.question)}\n",
+            extend(
+                (
+                    f"### {i}. {escape(decision.question)}\n",
                     f"- **ID**: `{decision.id}`",
                     f"- **Timestamp**: {decision.timestamp.isoformat()}",
-                    f"- **Consensus**: {_escape_markdown(decision.consensus)}",
+                    f"- **Consensus**: {escape(decision.consensus)}",
                     f"- **Status**: {decision.convergence_status}",
                     f"- **Participants**: {', '.join(decision.participants)}",
                     f"- **Transcript**: {decision.transcript_path}",
                     f"- **Winning Option**: {decision.winning_option or 'N/A'}\n",
-                ]
+                )
             )
 
         if similarities:
@@ -242,20 +281,18 @@ class DecisionGraphExporter:
                 ]
             )
 
-            for sim in sorted(
-                similarities, key=lambda s: s.similarity_score, reverse=True
-            )[
-                :20
-            ]:  # Top 20
-                source_q = next(
-                    (d.question[:20] for d in decisions if d.id == sim.source_id),
-                    "Unknown",
-                )
-                target_q = next(
-                    (d.question[:20] for d in decisions if d.id == sim.target_id),
-                    "Unknown",
-                )
-                lines.append(
+            # Index questions by ID once instead of scanning all decisions per
+            # relationship (reversed so the first decision wins on duplicate IDs)
+            question_by_id = {d.id: d.question[:20] for d in reversed(decisions)}
+
+            # Top 20 via a bounded heap: O(n log 20) instead of sorting all
+            # relationships (same order as sorted(..., reverse=True)[:20])
+            append = lines.append
+            question_for = question_by_id.get
+            for sim in heapq.nlargest(20, similarities, key=_BY_SIMILARITY_SCORE):
+                source_q = question_for(sim.source_id, "Unknown")
+                target_q = question_for(sim.target_id, "Unknown")
+                append(
                     f"| {source_q}... | {target_q}... | {sim.similarity_score:.2%} |"
                 )
 
@@ -274,49 +311,60 @@ class DecisionGraphExporter:
         if not results:
             return "No results found."
 
-        lines = [
-            "\n╔═══════════════════════════════════════════════════════════════════╗",
-            "║ Similar Decisions                                                 ║",
-            "╠═════════╦═══════════════════════════════╦════════════╦═════════════╣",
-            "║ Score   ║ Question                      ║ Consensus  ║ Status      ║",
-            "╠═════════╬═══════════════════════════════╬════════════╬═════════════╣",
-        ]
+        lines = [_SUMMARY_TABLE_HEADER]
 
+        append = lines.append
+        truncate = _truncate_text
+        format_row = _SUMMARY_ROW_FORMAT.format
         for result in results[:10]:  # Show top 10
             score_str = f"{result.score:.0%}".center(7)
-            question = _truncate_text(result.decision.question, 27)
-            consensus = _truncate_text(result.decision.consensus, 10)
+            question = truncate(result.decision.question, 27)
+            consensus = truncate(result.decision.consensus, 10)
             status = result.decision.convergence_status[:11]
 
-            lines.append(
-                f"║ {score_str} ║ {question:<29} ║ {consensus:<10} ║ {status:<11} ║"
-            )
+            append(format_row(score_str, question, consensus, status))
 
-        lines.append(
-            "╚═════════╩═══════════════════════════════╩════════════╩═════════════╝\n"
-        )
+        lines.append(_SUMMARY_TABLE_FOOTER)
 
         return "\n".join(lines)
 
 
+# Single-pass escape tables (one str.translate instead of chained replaces)
+_XML_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&apos;",
+    }
+)
+_MARKDOWN_ESCAPE_TABLE = str.maketrans({"|": "\\|", "\n": " "})
+
+# Most fields contain no special characters; a regex search is much cheaper
+# than translate() on clean text and lets us return the original string
+_XML_SPECIAL_RE = re.compile(r"[&<>\"']")
+_MARKDOWN_SPECIAL_RE = re.compile(r"[|\n]")
+
+
+@functools.lru_cache(maxsize=4096)
 def _escape_xml(text: str) -> str:
-    """Escape text for XML."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+    """Escape text for XML (memoized: fields repeat across exports)."""
+    if not _XML_SPECIAL_RE.search(text):
+        return text
+    return text.translate(_XML_ESCAPE_TABLE)
 
 
 def _escape_markdown(text: str) -> str:
     """Escape text for Markdown."""
-    return text.replace("|", "\\|").replace("\n", " ")
+    if not _MARKDOWN_SPECIAL_RE.search(text):
+        return text
+    return text.translate(_MARKDOWN_ESCAPE_TABLE)
 
 
+@functools.lru_cache(maxsize=4096)
 def _truncate_text(text: str, max_len: int) -> str:
-    """Truncate text to max length."""
+    """Truncate text to max length (memoized: questions repeat across exports)."""
     if len(text) > max_len:
         return text[: max_len - 3] + "..."
     return text
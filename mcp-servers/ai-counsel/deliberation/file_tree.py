@@ -1,6 +1,8 @@
 """File tree generation utility for repository structure visualization."""
 import logging
-from pathlib import Path
+import os
+import stat
+from os import scandir
 from typing import Optional, Set
 
 logger = logging.getLogger(__name__)
@@ -65,11 +67,14 @@ def generate_file_tree(
     """
     try:
         # Validate root path
-        root = Path(root_path).resolve()
-        if not root.exists():
+        root = os.path.realpath(root_path)
+        try:
+            # One stat() answers both "exists" and "is a directory"
+            root_mode = os.stat(root).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"Root path does not exist: {root_path}")
             return ""
-        if not root.is_dir():
+        if not stat.S_ISDIR(root_mode):
             logger.warning(f"Root path is not a directory: {root_path}")
             return ""
 
@@ -79,79 +84,102 @@ def generate_file_tree(
 
         # Build the tree
         lines = []
-        file_count = [0]  # Use list to allow mutation in nested function
-
-        def should_ignore(path: Path) -> bool:
-            """Check if path should be ignored."""
-            name = path.name
-            # Check exact matches
-            if name in ignore_patterns:
-                return True
-            # Check wildcard patterns
-            for pattern in ignore_patterns:
-                if '*' in pattern and name.endswith(pattern.replace('*', '')):
-                    return True
-            return False
-
-        def walk_tree(path: Path, prefix: str = "", depth: int = 0):
-            """Recursively walk directory tree."""
-            # Check file count limit
-            if file_count[0] >= max_files:
-                if file_count[0] == max_files:
-                    lines.append(f"{prefix}... (truncated at {max_files} files)")
-                    file_count[0] += 1
-                return
-
-            try:
-                # Get directory contents and filter in one pass
-                # Sort: directories first, then alphabetically
-                entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
-
-                # Filter ignored entries and directories exceeding max_depth
-                entries = [
-                    e for e in entries
-                    if not should_ignore(e)
-                    and not (e.is_dir() and depth + 1 > max_depth)
-                ]
-
-                for i, entry in enumerate(entries):
-                    # Check file count limit
-                    if file_count[0] >= max_files:
-                        lines.append(f"{prefix}... (truncated at {max_files} files)")
-                        file_count[0] += 1
-                        break
-
-                    is_last = i == len(entries) - 1
+        file_count = 0
 
-                    # Use ASCII or Unicode box-drawing characters
-                    if ascii_only:
-                        connector = "`-- " if is_last else "|-- "
-                        extension = "    " if is_last else "|   "
-                    else:
-                        connector = "└── " if is_last else "├── "
-                        extension = "    " if is_last else "│   "
+        # Split patterns once: exact names for a hash lookup, wildcard
+        # patterns into a suffix tuple for a single endswith() call
+        ignore_names = frozenset(ignore_patterns)
+        ignore_suffixes = tuple(
+            pattern.replace('*', '') for pattern in ignore_patterns if '*' in pattern
+        )
 
-                    if entry.is_dir():
-                        lines.append(f"{prefix}{connector}{entry.name}/")
-                        file_count[0] += 1
-
-                        # Recurse into directory
-                        walk_tree(entry, prefix + extension, depth + 1)
-                    else:
-                        lines.append(f"{prefix}{connector}{entry.name}")
-                        file_count[0] += 1
+        def should_ignore(name: str) -> bool:
+            """Check if an entry name should be ignored."""
+            return name in ignore_names or name.endswith(ignore_suffixes)
 
+        def list_dir(path: str, prefix: str, depth: int) -> list:
+            """List visible (name, is_dir, path) entries of a directory, sorted."""
+            try:
+                # os.scandir reuses the entry type from the directory listing,
+                # so is_dir() needs no extra stat() except for symlinks
+                with scandir(path) as it:
+                    entries = [
+                        (entry.name, entry.is_dir(), entry.path) for entry in it
+                    ]
             except PermissionError:
                 lines.append(f"{prefix}... (permission denied)")
+                return []
             except Exception as e:
                 logger.warning(f"Error reading directory {path}: {e}")
+                return []
+
+            # Filter ignored entries and directories exceeding max_depth
+            # Sort: directories first, then alphabetically
+            return sorted(
+                (
+                    e for e in entries
+                    if not should_ignore(e[0])
+                    and not (e[1] and depth + 1 > max_depth)
+                ),
+                key=lambda e: (not e[1], e[0]),
+            )
+
+        # (connector, child prefix extension) pairs, chosen once per tree.
+        # Use ASCII or Unicode box-drawing characters
+        if ascii_only:
+            branch, last_branch = ("|-- ", "|   "), ("`-- ", "    ")
+        else:
+            branch, last_branch = ("├── ", "│   "), ("└── ", "    ")
 
         # Start with root directory name
-        lines.append(f"{root.name}/")
-        walk_tree(root, "", 0)
+        lines.append(f"{os.path.basename(root)}/")
+
+        # Iterative depth-first walk (no recursion limit on deep trees).
+        # Each open directory is a frame [entries, next_index, prefix, depth, path];
+        # entries stay None until the frame is first visited, matching the
+        # order in which a recursive walk would list directories.
+        stack = [[None, 0, "", 0, root]]
+        while stack:
+            frame = stack[-1]
+            entries, i, prefix, depth, path = frame
+
+            if entries is None:
+                # Check file count limit before listing the directory
+                if file_count >= max_files:
+                    if file_count == max_files:
+                        lines.append(f"{prefix}... (truncated at {max_files} files)")
+                        file_count += 1
+                    stack.pop()
+                    continue
+                entries = frame[0] = list_dir(path, prefix, depth)
+
+            if i == len(entries):
+                stack.pop()
+                continue
+
+            # Check file count limit
+            if file_count >= max_files:
+                lines.append(f"{prefix}... (truncated at {max_files} files)")
+                file_count += 1
+                stack.pop()
+                continue
+
+            frame[1] = i + 1
+            connector, extension = last_branch if i == len(entries) - 1 else branch
+
+            name, is_dir, entry_path = entries[i]
+            if is_dir:
+                lines.append(f"{prefix}{connector}{name}/")
+                file_count += 1
+
+                # Descend into directory next
+                stack.append([None, 0, prefix + extension, depth + 1, entry_path])
+            else:
+                lines.append(f"{prefix}{connector}{name}")
+                file_count += 1
 
         tree_str = "\n".join(lines)
-        logger.info(f"Generated file tree: {file_count[0]} entries, {len(lines)} lines")
+        logger.info(f"Generated file tree: {file_count} entries, {len(lines)} lines")
         return tree_str
 
     except Exception as e:
@@ -2,9 +2,18 @@
 from typing import Optional
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 
 from adapters.base import BaseCLIAdapter
+from deliberation.tools import (
+    ListFilesTool,
+    ReadFileTool,
+    RunCommandTool,
+    SearchCodeTool,
+    ToolExecutor,
+)
+from deliberation.transcript import TranscriptManager
 
 
 class MockAdapter(BaseCLIAdapter):
@@ -40,6 +49,34 @@ class MockAdapter(BaseCLIAdapter):
         return raw_output.strip()
 
 
+class FakeAsyncClient:
+    """Lightweight stand-in for httpx.AsyncClient in HTTP adapter tests."""
+
+    def __init__(self):
+        """Initialize fake client with an empty call log and response."""
+        self.calls = []
+        self._response_json = {}
+
+    def set_response(self, response_json: dict) -> None:
+        """Set the JSON body returned by subsequent post() calls."""
+        self._response_json = response_json
+
+    async def post(self, url: str, json: Optional[dict] = None, **kwargs) -> httpx.Response:
+        """Record the request and return a 200 response with the configured JSON."""
+        self.calls.append((url, json))
+        return httpx.Response(
+            200, json=self._response_json, request=httpx.Request("POST", url)
+        )
+
+    async def __aenter__(self):
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Exit the client context."""
+        return None
+
+
 @pytest.fixture
 def mock_adapters():
     """
@@ -61,6 +98,45 @@ def mock_adapters():
     }
 
 
+@pytest.fixture(scope="session")
+def populated_tool_executor():
+    """
+    Tool executor with the standard deliberation tools registered.
+
+    Shared across the session: the executor only holds the tool registry,
+    while execution history lives on the engine.
+
+    Returns:
+        ToolExecutor: Executor with read/search/list/run tools registered
+    """
+    executor = ToolExecutor()
+    for tool_cls in (ReadFileTool, SearchCodeTool, ListFilesTool, RunCommandTool):
+        executor.register_tool(tool_cls())
+    return executor
+
+
+@pytest.fixture(scope="session")
+def shared_transcripts_dir(tmp_path_factory):
+    """
+    Session-wide transcripts directory.
+
+    Returns:
+        Path: Temporary directory shared by all transcript managers
+    """
+    return tmp_path_factory.mktemp("transcripts")
+
+
+@pytest.fixture
+def transcript_manager(shared_transcripts_dir):
+    """
+    Transcript manager writing into the shared session directory.
+
+    Returns:
+        TranscriptManager: Manager whose output_dir is shared_transcripts_dir
+    """
+    return TranscriptManager(output_dir=str(shared_transcripts_dir))
+
+
 @pytest.fixture
 def sample_config():
     """
@@ -57,6 +57,21 @@ class TestJaccardBackend:
         similarity = backend.compute_similarity("", "some text")
         assert similarity == 0.0
 
+    def test_similarity_matrix_matches_pairwise(self):
+        """Similarity matrix should be symmetric and agree with pairwise scores."""
+        backend = JaccardBackend()
+        texts = ["the quick brown fox", "the lazy brown dog", "airplane engine"]
+        matrix = backend.compute_similarity_matrix(texts)
+
+        for i in range(len(texts)):
+            assert matrix[i][i] == 1.0
+            for j in range(len(texts)):
+                assert matrix[i][j] == matrix[j][i]
+                if i != j:
+                    assert matrix[i][j] == backend.compute_similarity(
+                        texts[i], texts[j]
+                    )
+
 
 # =============================================================================
 # TF-IDF Backend Tests (optional dependency)
@@ -122,6 +137,19 @@ class TestSentenceTransformerBackend:
         # Should be high - same meaning
         assert similarity > 0.7
 
+    def test_similarity_matrix_matches_pairwise(self):
+        """Batched similarity matrix should agree with pairwise scores."""
+        pytest.importorskip("sentence_transformers", minversion="2.0")
+        backend = SentenceTransformerBackend()
+        texts = ["Option A", "option a", "Option D"]
+        matrix = backend.compute_similarity_matrix(texts)
+
+        assert len(matrix) == 3
+        assert all(len(row) == 3 for row in matrix)
+        assert matrix[0][1] == pytest.approx(
+            backend.compute_similarity(texts[0], texts[1]), abs=1e-4
+        )
+
 
 # =============================================================================
 # Convergence Detector Tests
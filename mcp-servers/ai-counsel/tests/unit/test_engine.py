@@ -1,18 +1,54 @@
 """Unit tests for deliberation engine."""
+import asyncio
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from deliberation.engine import DeliberationEngine
-from deliberation.tools import (
-    ToolExecutor,
-    ReadFileTool,
-    SearchCodeTool,
-    ListFilesTool,
-    RunCommandTool,
+from deliberation.convergence import SimilarityBackend
+from deliberation.engine import (
+    SEMANTIC_MERGE_THRESHOLD,
+    DeliberationEngine,
+    _merge_threshold_from_env,
 )
-from models.schema import Participant, RoundResponse, Vote
+from deliberation.tools import ReadFileTool, ToolExecutor
+from models.schema import DeliberateRequest, Participant, RoundResponse, Vote
+
+
+class FixedSimilarityBackend(SimilarityBackend):
+    """Similarity backend returning preset scores for unordered text pairs."""
+
+    def __init__(self, scores):
+        """Initialize with a {frozenset({text1, text2}): score} map."""
+        self.scores = scores
+
+    def compute_similarity(self, text1: str, text2: str) -> float:
+        """Look up the preset score for the pair."""
+        return self.scores[frozenset({text1, text2})]
+
+
+def engine_with_similarity_scores(scores):
+    """Create an engine whose vote grouping uses FixedSimilarityBackend(scores)."""
+    engine = DeliberationEngine({})
+    engine.convergence_detector = SimpleNamespace(backend=FixedSimilarityBackend(scores))
+    return engine
+
+
+@pytest.fixture(scope="module")
+def base_request():
+    """Validated request template; tests derive variants via model_copy()."""
+    return DeliberateRequest(
+        question="placeholder",
+        participants=[
+            Participant(cli="claude", model="claude-3-5-sonnet"),
+            Participant(cli="codex", model="gpt-4"),
+        ],
+        rounds=1,
+        mode="conference",
+        working_directory="/tmp",
+    )
 
 
 class TestDeliberationEngine:
@@ -78,6 +114,41 @@ class TestDeliberationEngine:
         assert responses[1].participant == "gpt-4@codex"
         assert responses[1].response == "Codex says no"
 
+    @pytest.mark.asyncio
+    async def test_execute_round_invokes_participants_concurrently(self, mock_adapters):
+        """Test that all participants in a round are invoked concurrently."""
+        engine = DeliberationEngine(mock_adapters)
+        state = {"active": 0, "peak": 0}
+
+        def make_invoke(text):
+            async def invoke(*args):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return text
+
+            return invoke
+
+        mock_adapters["claude"].invoke_mock.side_effect = make_invoke("Claude says yes")
+        mock_adapters["codex"].invoke_mock.side_effect = make_invoke("Codex says no")
+
+        participants = [
+            Participant(cli="claude", model="claude-3-5-sonnet"),
+            Participant(cli="codex", model="gpt-4"),
+        ]
+
+        responses = await engine.execute_round(
+            round_num=1,
+            prompt="Should we use TDD?",
+            participants=participants,
+            previous_responses=[],
+        )
+
+        assert state["peak"] == 2
+        # Responses keep participant order regardless of completion order
+        assert [r.response for r in responses] == ["Claude says yes", "Codex says no"]
+
     @pytest.mark.asyncio
     async def test_execute_round_includes_previous_context(self, mock_adapters):
         """Test that previous responses are included in context."""
@@ -181,22 +252,14 @@ class TestDeliberationEngineMultiRound:
     """Tests for DeliberationEngine multi-round execution."""
 
     @pytest.mark.asyncio
-    async def test_execute_multiple_rounds(self, mock_adapters):
+    async def test_execute_multiple_rounds(self, mock_adapters, base_request):
         """Test executing multiple rounds of deliberation."""
-        from models.schema import DeliberateRequest
-
         mock_adapters["claude"] = mock_adapters["claude"]
         engine = DeliberationEngine(mock_adapters)
 
-        request = DeliberateRequest(
-            question="What is the best programming language?",
-            participants=[
-                Participant(cli="claude", model="claude-3-5-sonnet"),
-                Participant(cli="codex", model="gpt-4"),
-            ],
-            rounds=3,
-            mode="conference",
-            working_directory="/tmp",)
+        request = base_request.model_copy(
+            update={"question": "What is the best programming language?", "rounds": 3}
+        )
 
         mock_adapters["claude"].invoke_mock.return_value = "Claude response"
         mock_adapters["codex"].invoke_mock.return_value = "Codex response"
@@ -210,22 +273,14 @@ class TestDeliberationEngineMultiRound:
         assert len(result.participants) == 2
 
     @pytest.mark.asyncio
-    async def test_execute_context_builds_across_rounds(self, mock_adapters):
+    async def test_execute_context_builds_across_rounds(self, mock_adapters, base_request):
         """Test that context accumulates across rounds."""
-        from models.schema import DeliberateRequest
-
         mock_adapters["claude"] = mock_adapters["claude"]
         engine = DeliberationEngine(mock_adapters)
 
-        request = DeliberateRequest(
-            question="Test question",
-            participants=[
-                Participant(cli="claude", model="claude-3-5-sonnet"),
-                Participant(cli="codex", model="gpt-4"),
-            ],
-            rounds=2,
-            mode="conference",
-            working_directory="/tmp",)
+        request = base_request.model_copy(
+            update={"question": "Test question", "rounds": 2}
+        )
 
         mock_adapters["claude"].invoke_mock.return_value = "Claude response"
         mock_adapters["codex"].invoke_mock.return_value = "Codex response"
@@ -240,22 +295,18 @@ class TestDeliberationEngineMultiRound:
         assert second_call[0][2] is not None  # context should be present
 
     @pytest.mark.asyncio
-    async def test_quick_mode_overrides_rounds(self, mock_adapters):
+    async def test_quick_mode_overrides_rounds(self, mock_adapters, base_request):
         """Test that quick mode forces single round regardless of request.rounds."""
-        from models.schema import DeliberateRequest
-
         mock_adapters["claude"] = mock_adapters["claude"]
         engine = DeliberationEngine(mock_adapters)
 
-        request = DeliberateRequest(
-            question="Test question",
-            participants=[
-                Participant(cli="claude", model="claude-3-5-sonnet"),
-                Participant(cli="codex", model="gpt-4"),
-            ],
-            rounds=5,  # Request 5 rounds
-            mode="quick",  # But quick mode should override to 1,
-            working_directory="/tmp",)
+        request = base_request.model_copy(
+            update={
+                "question": "Test question",
+                "rounds": 5,  # Request 5 rounds
+                "mode": "quick",  # But quick mode should override to 1
+            }
+        )
 
         mock_adapters["claude"].invoke_mock.return_value = "Claude response"
         mock_adapters["codex"].invoke_mock.return_value = "Codex response"
@@ -267,13 +318,8 @@ class TestDeliberationEngineMultiRound:
         assert len(result.full_debate) == 2  # 1 round * 2 participants
 
     @pytest.mark.asyncio
-    async def test_engine_saves_transcript(self, mock_adapters, tmp_path):
+    async def test_engine_saves_transcript(self, mock_adapters, transcript_manager):
         """Test that engine saves transcript after execution."""
-        from deliberation.transcript import TranscriptManager
-        from models.schema import DeliberateRequest
-
-        manager = TranscriptManager(output_dir=str(tmp_path))
-
         request = DeliberateRequest(
             question="Should we use TypeScript?",
             participants=[
@@ -289,16 +335,30 @@ class TestDeliberationEngineMultiRound:
         mock_adapters["claude"].invoke_mock.return_value = "Claude response"
         mock_adapters["codex"].invoke_mock.return_value = "Codex response"
 
-        engine = DeliberationEngine(adapters=mock_adapters, transcript_manager=manager)
-        result = await engine.execute(request)
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
+        with patch.object(
+            transcript_manager, "save", wraps=transcript_manager.save
+        ) as mock_save:
+            result = await engine.execute(request)
 
         # Verify transcript was saved
         assert result.transcript_path
-        assert Path(result.transcript_path).exists()
-
-        # Verify content
-        content = Path(result.transcript_path).read_text()
-        assert "Should we use TypeScript?" in content
+        transcript = Path(result.transcript_path)
+        assert transcript.exists()
+        assert transcript.parent == transcript_manager.output_dir
+
+        # Check the question handed to the transcript manager rather than the
+        # rendered file; transcript naming and content are covered by
+        # test_transcript.py
+        mock_save.assert_called_once()
+        assert mock_save.call_args.args[1] == "Should we use TypeScript?"
+        assert result.status == "complete"
+        assert result.participants == [
+            "claude-3-5-sonnet-20241022@claude",
+            "gpt-4@codex",
+        ]
 
 
 class TestVoteParsing:
@@ -465,24 +525,18 @@ class TestVoteParsing:
         assert "Option A" in responses[0].response
 
     @pytest.mark.asyncio
-    async def test_execute_aggregates_voting_results(self, mock_adapters, tmp_path):
+    async def test_execute_aggregates_voting_results(
+        self, mock_adapters, base_request, transcript_manager
+    ):
         """Test that votes are aggregated into VotingResult during execution."""
-        from deliberation.transcript import TranscriptManager
-        from models.schema import DeliberateRequest
-
-        manager = TranscriptManager(output_dir=str(tmp_path))
         mock_adapters["claude"] = mock_adapters["claude"]
-        engine = DeliberationEngine(adapters=mock_adapters, transcript_manager=manager)
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
 
-        request = DeliberateRequest(
-            question="Should we implement Option A or Option B?",
-            participants=[
-                Participant(cli="claude", model="claude-3-5-sonnet"),
-                Participant(cli="codex", model="gpt-4"),
-            ],
-            rounds=2,
-            mode="conference",
-            working_directory="/tmp",)
+        request = base_request.model_copy(
+            update={"question": "Should we implement Option A or Option B?", "rounds": 2}
+        )
 
         # Both vote for Option A in round 1
         mock_adapters["claude"].invoke_mock.side_effect = [
@@ -565,7 +619,9 @@ class TestEngineWithTools:
         assert "timeout" in tool_record.result.error.lower(), f"Error should mention timeout: {tool_record.result.error}"
 
     @pytest.mark.asyncio
-    async def test_tool_history_cleared_between_deliberations(self, mock_adapters, tmp_path):
+    async def test_tool_history_cleared_between_deliberations(
+        self, mock_adapters, populated_tool_executor, transcript_manager, tmp_path
+    ):
         """Test tool execution history is cleared between deliberations.
 
         CRITICAL MEMORY LEAK: tool_execution_history grows unbounded across deliberations
@@ -574,12 +630,10 @@ class TestEngineWithTools:
         Expected: History cleared at start of each deliberation.
         Actual (BUG): History accumulates indefinitely.
         """
-        engine = DeliberationEngine(mock_adapters)
-        engine.tool_executor = ToolExecutor()
-        engine.tool_executor.register_tool(ReadFileTool())
-        engine.tool_executor.register_tool(SearchCodeTool())
-        engine.tool_executor.register_tool(ListFilesTool())
-        engine.tool_executor.register_tool(RunCommandTool())
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
+        engine.tool_executor = populated_tool_executor
         engine.tool_execution_history = []
 
         # First deliberation with tool request
@@ -597,7 +651,6 @@ class TestEngineWithTools:
         ]
 
         # Execute first deliberation
-        from models.schema import DeliberateRequest
         request1 = DeliberateRequest(
             question="Test question for deliberation 1",
             participants=participants,
@@ -643,18 +696,18 @@ class TestEngineWithTools:
             "Should NOT contain first deliberation's tool (indicates memory leak)"
 
     @pytest.mark.asyncio
-    async def test_tool_history_memory_bounded(self, mock_adapters, tmp_path):
+    async def test_tool_history_memory_bounded(
+        self, mock_adapters, populated_tool_executor, transcript_manager, tmp_path
+    ):
         """Test tool history doesn't grow unbounded in long-running server.
 
         Simulates 10 deliberations to verify memory doesn't accumulate.
         In production: ~1-3MB per deliberation × unlimited = OOM crash.
         """
-        engine = DeliberationEngine(mock_adapters)
-        engine.tool_executor = ToolExecutor()
-        engine.tool_executor.register_tool(ReadFileTool())
-        engine.tool_executor.register_tool(SearchCodeTool())
-        engine.tool_executor.register_tool(ListFilesTool())
-        engine.tool_executor.register_tool(RunCommandTool())
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
+        engine.tool_executor = populated_tool_executor
         engine.tool_execution_history = []
 
         participants = [
@@ -672,7 +725,6 @@ class TestEngineWithTools:
             TOOL_REQUEST: {{"name": "read_file", "arguments": {{"path": "{test_file}"}}}}
             """
 
-            from models.schema import DeliberateRequest
             request = DeliberateRequest(
                 question=f"Test question for deliberation number {i}",
                 participants=participants,
@@ -768,125 +820,175 @@ class TestVoteGrouping:
         # Single option should return unchanged
         assert result == {"Option A": 3}
 
+    def test_group_similar_vote_options_uses_merge_threshold(self):
+        """Test that options merge only at or above SEMANTIC_MERGE_THRESHOLD."""
+        # Measured similarities: "option_a" is an alias, "Option D" (0.729)
+        # is a different choice that the old 0.70 threshold wrongly merged
+        scores = {
+            frozenset({"Option A", "option_a"}): 0.95,
+            frozenset({"Option A", "Option D"}): 0.729,
+            frozenset({"option_a", "Option D"}): 0.729,
+        }
+
+        engine = engine_with_similarity_scores(scores)
+
+        all_options = ["Option A", "option_a", "Option D"]
+        raw_tally = {"Option A": 2, "option_a": 1, "Option D": 1}
+
+        result = engine._group_similar_vote_options(all_options, raw_tally)
+
+        assert 0.729 < SEMANTIC_MERGE_THRESHOLD <= 0.95
+        assert result == {"Option A": 3, "Option D": 1}
+
+    def test_merge_threshold_uses_env_override(self, monkeypatch):
+        """Test a valid AI_COUNSEL_MERGE_THRESHOLD replaces the default."""
+        monkeypatch.setenv("AI_COUNSEL_MERGE_THRESHOLD", "0.9")
+
+        assert _merge_threshold_from_env() == 0.9
+
+    def test_merge_threshold_defaults_when_env_unset(self, monkeypatch):
+        """Test the threshold is 0.85 without AI_COUNSEL_MERGE_THRESHOLD."""
+        monkeypatch.delenv("AI_COUNSEL_MERGE_THRESHOLD", raising=False)
+
+        assert _merge_threshold_from_env() == 0.85
+
+    @pytest.mark.parametrize("raw_value", ["high", "", "nan", "0.5", "0.99", "1.5"])
+    def test_merge_threshold_falls_back_when_env_invalid(
+        self, monkeypatch, caplog, raw_value
+    ):
+        """Test malformed or out-of-range overrides warn and use 0.85."""
+        monkeypatch.setenv("AI_COUNSEL_MERGE_THRESHOLD", raw_value)
+
+        assert _merge_threshold_from_env() == 0.85
+        assert "AI_COUNSEL_MERGE_THRESHOLD" in caplog.text
+
+    def test_group_similar_vote_options_merges_transitively(self):
+        """Test that A~B and B~C groups all three, named after the first seen."""
+        # "A" and "C" are not similar directly, only through "B"
+        scores = {
+            frozenset({"Option C", "Option A"}): 0.10,
+            frozenset({"Option C", "Option B"}): 0.95,
+            frozenset({"Option A", "Option B"}): 0.95,
+        }
+
+        engine = engine_with_similarity_scores(scores)
+
+        all_options = ["Option C", "Option A", "Option B"]
+        raw_tally = {"Option C": 1, "Option A": 1, "Option B": 1}
+
+        result = engine._group_similar_vote_options(all_options, raw_tally)
+
+        assert result == {"Option C": 3}
+
     @pytest.mark.asyncio
-    async def test_aggregate_votes_different_options_not_merged(self, mock_adapters):
+    async def test_aggregate_votes_different_options_not_merged(
+        self, mock_adapters, transcript_manager
+    ):
         """Test that semantically different vote options (A vs D) are NOT merged.
 
         This is a regression test for bug where Option A and Option D (0.729 similarity)
         were incorrectly merged due to 0.70 threshold being too aggressive.
         """
-        import tempfile
-
-        from deliberation.transcript import TranscriptManager
-        from models.schema import DeliberateRequest
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            manager = TranscriptManager(output_dir=tmp_dir)
-            engine = DeliberationEngine(
-                adapters=mock_adapters, transcript_manager=manager
-            )
+        request = DeliberateRequest(
+            question="Docker compose approach?",
+            participants=[
+                Participant(cli="claude", model="sonnet"),
+                Participant(cli="codex", model="gpt-5-codex"),
+            ],
+            rounds=1,
+            mode="quick",
+        working_directory="/tmp",)
 
-            request = DeliberateRequest(
-                question="Docker compose approach?",
-                participants=[
-                    Participant(cli="claude", model="sonnet"),
-                    Participant(cli="codex", model="gpt-5-codex"),
-                ],
-                rounds=1,
-                mode="quick",
-            working_directory="/tmp",)
+        # Simulate the actual votes from docker-compose deliberation:
+        # Claude and Codex vote for Option A
+        # Gemini votes for Option D (but we use 2 adapters in fixture)
+        # So we'll test with Claude voting A, Codex voting D instead
+        mock_adapters["claude"].invoke_mock.side_effect = [
+            'Analysis...\n\nVOTE: {"option": "Option A", "confidence": 0.94, "rationale": "Single file"}',
+        ]
+        mock_adapters["codex"].invoke_mock.side_effect = [
+            'Analysis...\n\nVOTE: {"option": "Option D", "confidence": 0.95, "rationale": "Dual file"}',
+        ]
 
-            # Simulate the actual votes from docker-compose deliberation:
-            # Claude and Codex vote for Option A
-            # Gemini votes for Option D (but we use 2 adapters in fixture)
-            # So we'll test with Claude voting A, Codex voting D instead
-            mock_adapters["claude"].invoke_mock.side_effect = [
-                'Analysis...\n\nVOTE: {"option": "Option A", "confidence": 0.94, "rationale": "Single file"}',
-            ]
-            mock_adapters["codex"].invoke_mock.side_effect = [
-                'Analysis...\n\nVOTE: {"option": "Option D", "confidence": 0.95, "rationale": "Dual file"}',
-            ]
+        result = await engine.execute(request)
 
-            result = await engine.execute(request)
+        # Verify voting result
+        assert result.voting_result is not None
 
-            # Verify voting result
-            assert result.voting_result is not None
-
-            # KEY ASSERTION: Verify that A and D are NOT merged
-            # Expected: 1 vote for Option A, 1 vote for Option D (tie)
-            # Buggy behavior: 2 votes for Option A (D merged with A)
-
-            if len(result.voting_result.final_tally) == 2:
-                # If threshold is correct (0.85+), A and D should NOT merge
-                assert "Option A" in result.voting_result.final_tally
-                assert "Option D" in result.voting_result.final_tally
-                assert result.voting_result.final_tally["Option A"] == 1
-                assert result.voting_result.final_tally["Option D"] == 1
-                assert result.voting_result.consensus_reached is False  # 1-1 is tie
-                assert result.voting_result.winning_option is None
-            elif len(result.voting_result.final_tally) == 1:
-                # If threshold is still aggressive (0.70), A and D would merge
-                # This test documents the bug
-                assert (
-                    result.voting_result.final_tally["Option A"] == 2
-                ), "Bug confirmed: Option D was merged into Option A due to aggressive 0.70 threshold"
-                pytest.fail(
-                    "BUG CONFIRMED: Option A and Option D were incorrectly merged (threshold too aggressive)"
-                )
+        # KEY ASSERTION: Verify that A and D are NOT merged
+        # Expected: 1 vote for Option A, 1 vote for Option D (tie)
+        # Buggy behavior: 2 votes for Option A (D merged with A)
+
+        if len(result.voting_result.final_tally) == 2:
+            # With SEMANTIC_MERGE_THRESHOLD (0.85 default), A and D should NOT merge
+            assert "Option A" in result.voting_result.final_tally
+            assert "Option D" in result.voting_result.final_tally
+            assert result.voting_result.final_tally["Option A"] == 1
+            assert result.voting_result.final_tally["Option D"] == 1
+            assert result.voting_result.consensus_reached is False  # 1-1 is tie
+            assert result.voting_result.winning_option is None
+        elif len(result.voting_result.final_tally) == 1:
+            # If threshold is still aggressive (0.70), A and D would merge
+            # This test documents the bug
+            assert (
+                result.voting_result.final_tally["Option A"] == 2
+            ), "Bug confirmed: Option D was merged into Option A due to aggressive 0.70 threshold"
+            pytest.fail(
+                "BUG CONFIRMED: Option A and Option D were incorrectly merged (threshold too aggressive)"
+            )
 
     @pytest.mark.asyncio
-    async def test_aggregate_votes_respects_intent(self, mock_adapters):
+    async def test_aggregate_votes_respects_intent(
+        self, mock_adapters, transcript_manager
+    ):
         """Test that different options remain separate even if semantically similar."""
-        import tempfile
-
-        from deliberation.transcript import TranscriptManager
-        from models.schema import DeliberateRequest
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            manager = TranscriptManager(output_dir=tmp_dir)
-            mock_adapters["claude"] = mock_adapters["claude"]
-            engine = DeliberationEngine(
-                adapters=mock_adapters, transcript_manager=manager
-            )
+        mock_adapters["claude"] = mock_adapters["claude"]
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
 
-            request = DeliberateRequest(
-                question="Test question",
-                participants=[
-                    Participant(cli="claude", model="model1"),
-                    Participant(cli="codex", model="model2"),
-                ],
-                rounds=1,
-                mode="quick",
-            working_directory="/tmp",)
+        request = DeliberateRequest(
+            question="Test question",
+            participants=[
+                Participant(cli="claude", model="model1"),
+                Participant(cli="codex", model="model2"),
+            ],
+            rounds=1,
+            mode="quick",
+        working_directory="/tmp",)
 
-            # Two very different votes that shouldn't be merged
-            mock_adapters[
-                "claude"
-            ].invoke_mock.return_value = 'Analysis\n\nVOTE: {"option": "Yes", "confidence": 0.9, "rationale": "Good idea"}'
-            mock_adapters[
-                "codex"
-            ].invoke_mock.return_value = 'Analysis\n\nVOTE: {"option": "No", "confidence": 0.9, "rationale": "Bad idea"}'
+        # Two very different votes that shouldn't be merged
+        mock_adapters[
+            "claude"
+        ].invoke_mock.return_value = 'Analysis\n\nVOTE: {"option": "Yes", "confidence": 0.9, "rationale": "Good idea"}'
+        mock_adapters[
+            "codex"
+        ].invoke_mock.return_value = 'Analysis\n\nVOTE: {"option": "No", "confidence": 0.9, "rationale": "Bad idea"}'
 
-            result = await engine.execute(request)
+        result = await engine.execute(request)
 
-            # Verify that "Yes" and "No" are never merged
-            assert result.voting_result is not None
-            assert len(result.voting_result.final_tally) == 2
-            assert result.voting_result.consensus_reached is False  # 1-1 tie
-            assert result.voting_result.winning_option is None  # No winner in tie
+        # Verify that "Yes" and "No" are never merged
+        assert result.voting_result is not None
+        assert len(result.voting_result.final_tally) == 2
+        assert result.voting_result.consensus_reached is False  # 1-1 tie
+        assert result.voting_result.winning_option is None  # No winner in tie
 
 
 class TestEngineContextEfficiency:
     """Tests for context building efficiency and token optimization."""
 
     @pytest.mark.asyncio
-    async def test_context_truncates_large_tool_outputs(self, mock_adapters, tmp_path):
+    async def test_context_truncates_large_tool_outputs(
+        self, mock_adapters, transcript_manager, tmp_path
+    ):
         """Test large tool outputs are truncated to prevent bloat."""
-        from deliberation.transcript import TranscriptManager
-        from models.schema import DeliberateRequest
-
-        manager = TranscriptManager(output_dir=str(tmp_path))
-        engine = DeliberationEngine(adapters=mock_adapters, transcript_manager=manager)
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
 
         # Create large file
         large_file = tmp_path / "large.txt"
@@ -924,13 +1026,11 @@ class TestEngineContextEfficiency:
         assert result.rounds_completed == 2
 
     @pytest.mark.asyncio
-    async def test_context_includes_only_recent_rounds(self, mock_adapters, tmp_path):
+    async def test_context_includes_only_recent_rounds(self, mock_adapters, transcript_manager):
         """Test context only includes tool results from recent N rounds."""
-        from deliberation.transcript import TranscriptManager
-        from models.schema import DeliberateRequest
-
-        manager = TranscriptManager(output_dir=str(tmp_path))
-        engine = DeliberationEngine(adapters=mock_adapters, transcript_manager=manager)
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
 
         participants = [
             Participant(cli="claude", model="sonnet", stance="neutral"),
@@ -963,18 +1063,16 @@ class TestEngineContextEfficiency:
         assert len(result.full_debate) == 10  # 5 rounds * 2 participants
 
     @pytest.mark.asyncio
-    async def test_context_size_bounded_across_rounds(self, mock_adapters, tmp_path):
+    async def test_context_size_bounded_across_rounds(self, mock_adapters, transcript_manager):
         """Test context size remains bounded even in long deliberations.
 
         Note: This test verifies that _build_context accepts current_round_num parameter.
         The actual tool result truncation logic will be tested when tool execution is added.
         For now, we verify that the parameter is accepted and context builds correctly.
         """
-        from deliberation.transcript import TranscriptManager
-        from models.schema import DeliberateRequest
-
-        manager = TranscriptManager(output_dir=str(tmp_path))
-        engine = DeliberationEngine(adapters=mock_adapters, transcript_manager=manager)
+        engine = DeliberationEngine(
+            adapters=mock_adapters, transcript_manager=transcript_manager
+        )
 
         participants = [
             Participant(cli="claude", model="sonnet", stance="neutral"),
@@ -1038,6 +1136,15 @@ class TestEngineContextEfficiency:
         assert "truncated" in result.lower()
         assert "1000 chars" in result.lower() or "1000" in result
 
+    def test_truncate_output_counts_dropped_lines(self):
+        """Test that the indicator reports only the chars and lines cut off."""
+        engine = DeliberationEngine({})
+
+        text = "line\n" * 10  # 50 chars, 10 newlines
+        result = engine._truncate_output(text, max_chars=12)
+
+        assert result == "line\nline\nli\n... [truncated 38 chars, 8 lines]"
+
     def test_truncate_output_none(self):
         """Test that None/empty inputs are handled gracefully."""
         engine = DeliberationEngine({})
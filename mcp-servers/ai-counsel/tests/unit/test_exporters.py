@@ -232,6 +232,40 @@ class TestToJson:
         data = json.loads(result)
         assert data["decisions"][0]["winning_option"] is None
 
+    def test_should_use_generated_at_when_provided(
+        self, sample_decision_nodes, fixed_datetime
+    ):
+        """Test JSON export stamps the caller-supplied time instead of now()."""
+        with patch("deliberation.exporters.datetime") as mock_datetime:
+            result = DecisionGraphExporter.to_json(
+                sample_decision_nodes, generated_at=fixed_datetime
+            )
+
+        mock_datetime.now.assert_not_called()
+        data = json.loads(result)
+        assert data["exported_at"] == fixed_datetime.isoformat()
+
+    def test_should_match_orjson_output_when_using_stdlib_fallback(
+        self, sample_decision_nodes, sample_similarities, fixed_datetime
+    ):
+        """Test the stdlib fallback writes the same JSON as orjson, unescaped."""
+        pytest.importorskip("orjson")
+        question = "Café & naïve — should we ship?"
+        decisions = [sample_decision_nodes[0].model_copy(update={"question": question})]
+
+        with_orjson = DecisionGraphExporter.to_json(
+            decisions, sample_similarities, generated_at=fixed_datetime
+        )
+        with patch("deliberation.exporters.orjson", None):
+            with_stdlib = DecisionGraphExporter.to_json(
+                decisions, sample_similarities, generated_at=fixed_datetime
+            )
+
+        assert json.loads(with_stdlib) == json.loads(with_orjson)
+        assert json.loads(with_stdlib)["decisions"][0]["question"] == question
+        assert question in with_orjson
+        assert question in with_stdlib
+
 
 # ============================================================================
 # TEST: to_graphml() - GraphML Export
@@ -462,6 +496,18 @@ class TestToMarkdown:
         assert "### 1. Should we implement feature X?" in result
         assert "### 2. What is the best approach for testing?" in result
 
+    def test_should_use_generated_at_when_provided(
+        self, sample_decision_nodes, fixed_datetime
+    ):
+        """Test Markdown export stamps the caller-supplied time instead of now()."""
+        with patch("deliberation.exporters.datetime") as mock_datetime:
+            result = DecisionGraphExporter.to_markdown(
+                sample_decision_nodes, generated_at=fixed_datetime
+            )
+
+        mock_datetime.now.assert_not_called()
+        assert f"_Generated: {fixed_datetime.isoformat()}_" in result
+
     def test_should_escape_markdown_special_chars(self, decision_with_special_chars):
         """Test Markdown export escapes pipe characters and newlines."""
         result = DecisionGraphExporter.to_markdown([decision_with_special_chars])
@@ -3,13 +3,34 @@ import pytest
 
 from adapters.gemini import GeminiAdapter
 
+# Large prompt inputs are built once at import rather than in every test.
+# Previous-round context, as injected in round 2+ deliberations:
+_PREVIOUS_ROUND_CONTEXT = """Previous discussion:
+
+Round 1 - claude@cli (for): I recommend Option 2 (File-by-File Port) because it provides the safest path forward with minimal risk. Here's my reasoning:
+
+1. **Safety First**: The TypedDI migration is already deployed to production (v2.360.321). We cannot risk accidentally restoring legacy DI infrastructure through a complex rebase or cherry-pick operation.
+
+2. **Time Efficiency**: 30-45 minutes is reasonable and manageable. While cherry-picking preserves history, the 45-60 minute estimate doesn't account for potential complications or additional conflicts beyond the legacy DI imports.
+
+3. **Complete Control**: Manual file copying gives us explicit control over what gets ported. We can verify each change incrementally and test as we go, reducing the chance of introducing bugs or unwanted code.
+
+Round 1 - codex@cli (neutral): Both Option 1 and Option 2 have merit depending on priorities. If commit history and git blame are important for future debugging and understanding the evolution of the metrics feature, Option 1 (Cherry-Pick) is worth the extra 15-30 minutes. However, if the primary goal is speed and safety, Option 2 is the clear winner."""
+
+# Simulate 50+ rounds of context (each round adds ~2k chars)
+# This creates a prompt exceeding 100k characters
+_VERY_LONG_CONTEXT = _PREVIOUS_ROUND_CONTEXT * 100  # ~118k chars
+
+# 200k characters (~50k tokens at ~4 chars per token)
+_VERY_LONG_PROMPT = "A" * 200000
+
 
 class TestGeminiLongPrompts:
     """Tests for Gemini adapter handling of long prompts."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def gemini_adapter(self):
-        """Create a Gemini adapter instance."""
+        """Create a Gemini adapter instance (stateless, shared across tests)."""
         return GeminiAdapter(
             command="gemini", args=["-m", "{model}", "-p", "{prompt}"], timeout=180
         )
@@ -51,23 +72,9 @@ class TestGeminiLongPrompts:
 - User has exact commit list (24 core metrics + 21 infrastructure/docs)
 - Goal: Get working flexible time periods without restoring legacy DI"""
 
-        # Add context to make it even longer (simulates round 2+ with previous responses)
-        context = """Previous discussion:
-
-Round 1 - claude@cli (for): I recommend Option 2 (File-by-File Port) because it provides the safest path forward with minimal risk. Here's my reasoning:
-
-1. **Safety First**: The TypedDI migration is already deployed to production (v2.360.321). We cannot risk accidentally restoring legacy DI infrastructure through a complex rebase or cherry-pick operation.
-
-2. **Time Efficiency**: 30-45 minutes is reasonable and manageable. While cherry-picking preserves history, the 45-60 minute estimate doesn't account for potential complications or additional conflicts beyond the legacy DI imports.
-
-3. **Complete Control**: Manual file copying gives us explicit control over what gets ported. We can verify each change incrementally and test as we go, reducing the chance of introducing bugs or unwanted code.
-
-Round 1 - codex@cli (neutral): Both Option 1 and Option 2 have merit depending on priorities. If commit history and git blame are important for future debugging and understanding the evolution of the metrics feature, Option 1 (Cherry-Pick) is worth the extra 15-30 minutes. However, if the primary goal is speed and safety, Option 2 is the clear winner."""
 
-        # Simulate 50+ rounds of context (each round adds ~2k chars)
-        # This creates a prompt exceeding 100k characters
-        very_long_context = context * 100  # Repeat context 100 times = ~118k chars
-        full_prompt_with_context = f"{very_long_context}\n\n{long_prompt}"
+        # Prepend 100 rounds of previous-response context (~118k chars)
+        full_prompt_with_context = f"{_VERY_LONG_CONTEXT}\n\n{long_prompt}"
 
         # Test that adapter has a method to validate prompt length
         # Expected: Should have validate_prompt_length() method that returns False for long prompts
@@ -87,7 +94,7 @@ Round 1 - codex@cli (neutral): Both Option 1 and Option 2 have merit depending o
         """
         # Gemini API typically has token limits around 30k-100k tokens
         # A rough estimate is ~4 chars per token, so 200k chars = ~50k tokens
-        very_long_prompt = "A" * 200000  # 200k characters
+        very_long_prompt = _VERY_LONG_PROMPT
 
         # Should have a validation method
         assert hasattr(
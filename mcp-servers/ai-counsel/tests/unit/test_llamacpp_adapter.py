@@ -26,6 +26,11 @@ from adapters.llamacpp import LlamaCppAdapter
 class TestLlamaCppAdapter:
     """Tests for LlamaCppAdapter."""
 
+    @pytest.fixture(scope="module")
+    def parse_adapter(self):
+        """Create an adapter for parse_output tests (stateless, shared across tests)."""
+        return LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
+
     def test_should_initialize_with_correct_defaults_when_created(self):
         """Test adapter initializes with correct command and timeout."""
         adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"], timeout=120)
@@ -40,10 +45,8 @@ class TestLlamaCppAdapter:
 
         assert "args must be provided" in str(exc_info.value)
 
-    def test_should_extract_response_when_parsing_verbose_output(self):
+    def test_should_extract_response_when_parsing_verbose_output(self, parse_adapter):
         """Test parsing extracts model response from verbose llama.cpp output."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         # Typical llama.cpp output includes metadata before/after response
         raw_output = """
 llama_model_loader: loaded meta data with 20 key-value pairs and 291 tensors
@@ -64,7 +67,7 @@ llama_print_timings:        eval time =   890.12 ms /   128 tokens
 llama_print_timings:       total time =  1234.56 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         # Should extract only the actual response
         assert "The answer to your question is 42" in result
@@ -75,10 +78,8 @@ llama_print_timings:       total time =  1234.56 ms
         assert "llama_print_timings" not in result
         assert "sampling:" not in result
 
-    def test_should_handle_multiline_response_when_parsing_output(self):
+    def test_should_handle_multiline_response_when_parsing_output(self, parse_adapter):
         """Test parsing preserves multiline responses."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_new_context_with_model: n_ctx = 512
 sampling: repeat_last_n = 64
@@ -94,7 +95,7 @@ This covers all aspects of your question.
 llama_print_timings:        load time =   123.45 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         # Should preserve multiline structure
         assert "Here is my detailed answer:" in result
@@ -106,10 +107,8 @@ llama_print_timings:        load time =   123.45 ms
         assert "llama_new_context" not in result
         assert "llama_print_timings" not in result
 
-    def test_should_extract_response_when_output_has_no_timings(self):
+    def test_should_extract_response_when_output_has_no_timings(self, parse_adapter):
         """Test parsing works when llama.cpp output lacks timing info."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_model_loader: loaded meta data
 sampling: repeat_last_n = 64
@@ -117,16 +116,14 @@ sampling: repeat_last_n = 64
 This is a simple response without timing information at the end.
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert "This is a simple response" in result
         assert "llama_model_loader" not in result
         assert "sampling:" not in result
 
-    def test_should_handle_empty_lines_when_parsing_output(self):
+    def test_should_handle_empty_lines_when_parsing_output(self, parse_adapter):
         """Test parsing handles empty lines gracefully."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_new_context_with_model: n_ctx = 512
 
@@ -137,16 +134,14 @@ Response with empty lines above and below.
 llama_print_timings: total time = 100 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert "Response with empty lines" in result
         # Should preserve internal empty lines but strip leading/trailing
         assert result.strip() == "Response with empty lines above and below."
 
-    def test_should_strip_whitespace_when_parsing_output(self):
+    def test_should_strip_whitespace_when_parsing_output(self, parse_adapter):
         """Test parsing strips leading and trailing whitespace."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_new_context_with_model: n_ctx = 512
 
@@ -155,19 +150,17 @@ llama_new_context_with_model: n_ctx = 512
 llama_print_timings: total time = 100 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         # Should strip outer whitespace but preserve sentence structure
         assert result.strip() == "Response with indentation and trailing spaces."
 
-    def test_should_handle_response_only_output_when_parsing(self):
+    def test_should_handle_response_only_output_when_parsing(self, parse_adapter):
         """Test parsing handles output with minimal metadata."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         # Some llama.cpp builds may have minimal output
         raw_output = "Just the response text without metadata."
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert result == "Just the response text without metadata."
 
@@ -284,10 +277,8 @@ llama_print_timings: total time = 100 ms
         assert "Answer this:" in combined_prompt
         assert result == "Response with context."
 
-    def test_should_handle_response_with_code_blocks_when_parsing(self):
+    def test_should_handle_response_with_code_blocks_when_parsing(self, parse_adapter):
         """Test parsing preserves code blocks in response."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_new_context_with_model: n_ctx = 512
 
@@ -303,7 +294,7 @@ This demonstrates the concept.
 llama_print_timings: total time = 200 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert "Here's a code example:" in result
         assert "```python" in result
@@ -311,10 +302,8 @@ llama_print_timings: total time = 200 ms
         assert "This demonstrates the concept." in result
         assert "llama_print_timings" not in result
 
-    def test_should_handle_special_characters_when_parsing_output(self):
+    def test_should_handle_special_characters_when_parsing_output(self, parse_adapter):
         """Test parsing preserves special characters in response."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_new_context_with_model: n_ctx = 512
 
@@ -325,7 +314,7 @@ Mathematical symbols: ∑ ∫ √ π
 llama_print_timings: total time = 100 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert "@#$%^&*()" in result
         assert '"quotes"' in result
@@ -333,10 +322,8 @@ llama_print_timings: total time = 100 ms
         assert "∑ ∫ √ π" in result
         assert "llama_print_timings" not in result
 
-    def test_should_filter_eof_marker_when_parsing_output(self):
+    def test_should_filter_eof_marker_when_parsing_output(self, parse_adapter):
         """Test parsing filters out EOF marker from truncated responses."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_new_context_with_model: n_ctx = 512
 sampling: repeat_last_n = 64
@@ -348,7 +335,7 @@ VOTE: {"option": "LFU", "confidence":
 llama_print_timings: total time = 100 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert "This is a response that got truncated" in result
         assert "VOTE:" in result
@@ -359,10 +346,8 @@ llama_print_timings: total time = 100 ms
         assert "llama_new_context" not in result
         assert "llama_print_timings" not in result
 
-    def test_should_filter_ggml_messages_when_parsing_output(self):
+    def test_should_filter_ggml_messages_when_parsing_output(self, parse_adapter):
         """Test parsing filters out ggml/gguf library messages."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 ggml_metal_init: using Metal library
 gguf_init_from_file: loading model
@@ -373,7 +358,7 @@ This is the actual response text.
 llama_print_timings: total time = 100 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert "This is the actual response text" in result
         # Should NOT include ggml/gguf messages
@@ -381,10 +366,8 @@ llama_print_timings: total time = 100 ms
         assert "gguf_" not in result
         assert "llama_model_loader" not in result
 
-    def test_should_filter_standalone_prompt_markers_when_parsing(self):
+    def test_should_filter_standalone_prompt_markers_when_parsing(self, parse_adapter):
         """Test parsing filters out standalone prompt markers."""
-        adapter = LlamaCppAdapter(args=["-m", "{model}", "-p", "{prompt}"])
-
         raw_output = """
 llama_new_context_with_model: n_ctx = 512
 
@@ -395,7 +378,7 @@ Second line of response
 llama_print_timings: total time = 100 ms
         """
 
-        result = adapter.parse_output(raw_output)
+        result = parse_adapter.parse_output(raw_output)
 
         assert "First line of response" in result
         assert "Second line of response" in result
@@ -497,6 +480,29 @@ class TestLlamaCppAutoDiscovery:
         # Should prefer exact stem match
         assert resolved == str(exact_match)
 
+    def test_should_stop_scanning_when_exact_match_found(self, tmp_path):
+        """Test the search returns on an exact match without walking later paths."""
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        exact_match = first_dir / "llama-2.gguf"
+        exact_match.touch()
+        (second_dir / "llama-2-7b.gguf").touch()
+
+        adapter = LlamaCppAdapter(
+            args=["-m", "{model}", "-p", "{prompt}"],
+            search_paths=[str(first_dir), str(second_dir)],
+        )
+
+        with patch.object(
+            adapter, "_iter_gguf_files", wraps=adapter._iter_gguf_files
+        ) as mock_iter:
+            resolved = adapter._resolve_model_path("llama-2")
+
+        assert resolved == str(exact_match)
+        mock_iter.assert_called_once_with(str(first_dir))
+
     def test_should_return_shortest_path_when_no_exact_match(self, tmp_path):
         """Test shortest path is returned when multiple fuzzy matches exist."""
         models_dir = tmp_path / "models"
@@ -517,6 +523,44 @@ class TestLlamaCppAutoDiscovery:
         # Both match "llama", but shortest path should win
         assert resolved == str(short_path)
 
+    def test_should_reuse_resolved_path_when_model_requested_again(self, tmp_path):
+        """Test repeated name lookups are served from cache without rescanning."""
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+        model_file = models_dir / "llama-2-7b.gguf"
+        model_file.touch()
+
+        adapter = LlamaCppAdapter(
+            args=["-m", "{model}", "-p", "{prompt}"],
+            search_paths=[str(models_dir)],
+        )
+        first = adapter._resolve_model_path("llama-2")
+
+        with patch.object(adapter, "_search_model_path") as mock_search:
+            second = adapter._resolve_model_path("llama-2")
+
+        assert first == second == str(model_file)
+        mock_search.assert_not_called()
+
+    def test_should_search_again_when_cached_model_file_removed(self, tmp_path):
+        """Test a cached path is dropped once the model file disappears."""
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+        old_model = models_dir / "llama-2-7b.gguf"
+        new_model = models_dir / "llama-2-13b.gguf"
+        old_model.touch()
+
+        adapter = LlamaCppAdapter(
+            args=["-m", "{model}", "-p", "{prompt}"],
+            search_paths=[str(models_dir)],
+        )
+        assert adapter._resolve_model_path("llama-2") == str(old_model)
+
+        old_model.unlink()
+        new_model.touch()
+
+        assert adapter._resolve_model_path("llama-2") == str(new_model)
+
     def test_should_raise_file_not_found_when_model_does_not_exist(self, tmp_path):
         """Test helpful error when model cannot be found."""
         adapter = LlamaCppAdapter(
@@ -556,6 +600,42 @@ class TestLlamaCppAutoDiscovery:
         assert "model-a" in error_msg
         assert "model-b" in error_msg
 
+    def test_should_scan_search_path_once_when_model_not_found(self, tmp_path):
+        """Test the error listing reuses the failed search instead of rescanning."""
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+        (models_dir / "model-a.gguf").touch()
+
+        adapter = LlamaCppAdapter(
+            args=["-m", "{model}", "-p", "{prompt}"],
+            search_paths=[str(models_dir)],
+        )
+
+        with patch.object(
+            adapter, "_iter_gguf_files", wraps=adapter._iter_gguf_files
+        ) as mock_iter:
+            with pytest.raises(FileNotFoundError) as exc_info:
+                adapter._resolve_model_path("nonexistent")
+
+        assert "model-a (models/model-a.gguf)" in str(exc_info.value)
+        mock_iter.assert_called_once_with(str(models_dir))
+
+    def test_should_skip_search_path_when_it_is_a_file(self, tmp_path, monkeypatch):
+        """Test a search path pointing at a file is skipped, not raised."""
+        model_file = tmp_path / "model.gguf"
+        model_file.touch()
+        monkeypatch.setenv("LLAMA_CPP_MODEL_PATH", str(model_file))
+
+        adapter = LlamaCppAdapter(
+            args=["-m", "{model}", "-p", "{prompt}"],
+            search_paths=[],
+        )
+
+        with pytest.raises(FileNotFoundError) as exc_info:
+            adapter._resolve_model_path("llama")
+
+        assert "Model not found" in str(exc_info.value)
+
     def test_should_expand_tilde_in_search_paths(self, tmp_path, monkeypatch):
         """Test that ~ in search paths is expanded to home directory."""
         # Mock home directory
@@ -617,6 +697,25 @@ class TestLlamaCppAutoDiscovery:
         assert resolved1 == str(model1)
         assert resolved2 == str(model2)
 
+    def test_should_refresh_search_paths_when_env_var_changes(self, tmp_path, monkeypatch):
+        """Test memoized search paths follow later LLAMA_CPP_MODEL_PATH changes."""
+        dir1 = tmp_path / "dir1"
+        dir2 = tmp_path / "dir2"
+        monkeypatch.setenv("LLAMA_CPP_MODEL_PATH", str(dir1))
+
+        adapter = LlamaCppAdapter(
+            args=["-m", "{model}", "-p", "{prompt}"],
+            search_paths=[],
+        )
+        first = adapter._get_expanded_search_paths()
+        assert adapter._get_expanded_search_paths() is first
+
+        monkeypatch.setenv("LLAMA_CPP_MODEL_PATH", str(dir2))
+        refreshed = adapter._get_expanded_search_paths()
+
+        assert dir2 in refreshed
+        assert dir1 not in refreshed
+
     def test_should_deduplicate_search_paths(self, tmp_path):
         """Test that duplicate search paths are deduplicated."""
         models_dir = tmp_path / "models"
@@ -660,7 +759,10 @@ class TestLlamaCppAutoDiscovery:
             search_paths=[str(models_dir)],
         )
 
-        error_msg = adapter._format_available_models()
+        with pytest.raises(FileNotFoundError) as exc_info:
+            adapter._resolve_model_path("nonexistent")
+
+        error_msg = str(exc_info.value)
 
         # Should limit to 10 and show "... and N more"
         assert "... and 5 more" in error_msg
@@ -675,7 +777,10 @@ class TestLlamaCppAutoDiscovery:
             search_paths=[str(empty_dir)],
         )
 
-        error_msg = adapter._format_available_models()
+        with pytest.raises(FileNotFoundError) as exc_info:
+            adapter._resolve_model_path("nonexistent")
+
+        error_msg = str(exc_info.value)
         assert "No .gguf models found" in error_msg
 
     @pytest.mark.asyncio
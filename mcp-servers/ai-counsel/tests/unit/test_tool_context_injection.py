@@ -209,6 +209,11 @@ TOOL_REQUEST: {{"name": "read_file", "arguments": {{"path": "{test_file}"}}}}
         # Verify we have 5 tool executions
         assert len(engine.tool_execution_history) == 5, "Should have 5 tool executions"
 
+        # _build_context binary-searches the history, which relies on it
+        # being kept in round order
+        round_numbers = [r.round_number for r in engine.tool_execution_history]
+        assert round_numbers == sorted(round_numbers)
+
         # Build context for round 6 (should only include rounds 4-5 with default max_rounds=2)
         context = engine._build_context(all_responses, current_round_num=6)
 
@@ -293,6 +298,77 @@ TOOL_REQUEST: {"name": "read_file", "arguments": {"path": "/nonexistent/file.txt
         assert "Response without tools" in context
         assert "Recent Tool Results" not in context  # No tools section
 
+    def test_build_context_includes_only_recent_round_tools(self):
+        """Test that only tool results from the last N rounds reach the context."""
+        engine = DeliberationEngine({})
+        engine.tool_execution_history = [
+            ToolExecutionRecord(
+                round_number=round_num,
+                request=ToolRequest(
+                    name="read_file", arguments={"path": f"/round{round_num}.txt"}
+                ),
+                result=ToolResult(
+                    tool_name="read_file",
+                    success=True,
+                    output=f"output from round {round_num}",
+                    error=None,
+                ),
+                requested_by="test@cli",
+            )
+            for round_num in (1, 1, 2, 3, 4)
+        ]
+
+        previous = [
+            RoundResponse(
+                round=4,
+                participant="model@cli",
+                response="Response",
+                timestamp=datetime.now().isoformat(),
+            )
+        ]
+
+        # Default window is 2 rounds: round 5 sees tools from rounds 3 and 4
+        context = engine._build_context(previous, current_round_num=5)
+
+        assert "output from round 3" in context
+        assert "output from round 4" in context
+        assert "output from round 2" not in context
+        assert "output from round 1" not in context
+
+    @pytest.mark.parametrize("current_round_num", [2, 3, 4, 5])
+    def test_build_context_window_boundary_keeps_every_record_of_first_round(
+        self, current_round_num
+    ):
+        """Test the window starts at the first record of its oldest round."""
+        engine = DeliberationEngine({})
+        engine.tool_execution_history = [
+            ToolExecutionRecord(
+                round_number=round_num,
+                request=ToolRequest(
+                    name="read_file", arguments={"path": f"/round{round_num}.txt"}
+                ),
+                result=ToolResult(
+                    tool_name="read_file",
+                    success=True,
+                    output=f"output {index} from round {round_num}",
+                    error=None,
+                ),
+                requested_by="test@cli",
+            )
+            for index, round_num in enumerate((1, 1, 2, 2, 3, 3, 4))
+        ]
+
+        context = engine._build_context([], current_round_num=current_round_num)
+
+        # Default window is 2 rounds
+        min_round = max(1, current_round_num - 2)
+        for index, record in enumerate(engine.tool_execution_history):
+            output = f"output {index} from round {record.round_number}"
+            if record.round_number >= min_round:
+                assert output in context
+            else:
+                assert output not in context
+
     def test_build_context_with_no_current_round_num(self):
         """Test that context building works when current_round_num is None."""
         engine = DeliberationEngine({})